@@ -0,0 +1,241 @@
+-- TNT Corporate Lead System - daily_metrics Backfill
+-- Phase 2 Architecture - PostgreSQL 15
+--
+-- One-time rebuild of daily_metrics and daily_metrics_breakdown from the
+-- existing leads and lead_interactions. The dashboard views
+-- (conversion_funnel, response_time_metrics, dashboard_summary) read only
+-- these tables, which the MetricsAggregator then keeps current.
+--
+-- Run once after applying database-schema.sql and BEFORE starting the
+-- aggregator: rows are replaced (not incremented), so running it while
+-- the aggregator is flushing would discard those deltas. Re-running it
+-- with the aggregator stopped is safe.
+--
+-- Semantics match integration_configs/aggregator.py:
+-- - leads, funnel stages and revenue by lead creation date, current status
+-- - response time = first automated email_sent/sms_sent after creation
+-- - emails sent/opened/clicked on the day they happened
+
+BEGIN;
+
+-- =====================================================
+-- PER-LEAD AND PER-EMAIL FACTS
+-- =====================================================
+
+CREATE TEMP TABLE backfill_facts ON COMMIT DROP AS
+SELECT
+    l.created_at::date AS metric_date,
+    l.service_type::text AS service_type,
+    l.source,
+    1 AS leads_created,
+    (l.status IN ('contacted', 'qualified', 'converted'))::int AS leads_contacted,
+    (l.status IN ('qualified', 'converted'))::int AS leads_qualified,
+    (l.status = 'converted')::int AS leads_converted,
+    COALESCE(l.estimated_value, 0) AS estimated_pipeline_value,
+    CASE WHEN l.status = 'converted' THEN COALESCE(l.estimated_value, 0) ELSE 0 END AS converted_revenue,
+    (EXTRACT(ISODOW FROM l.created_at) >= 6)::int AS weekend_leads_count,
+    ROUND(GREATEST(EXTRACT(EPOCH FROM (r.responded_at - l.created_at)) / 60, 0)::numeric, 2) AS response_minutes,
+    (r.trace_id IS NOT NULL) AS traced,
+    0 AS emails_sent,
+    0 AS emails_opened,
+    0 AS emails_clicked
+FROM leads l
+LEFT JOIN LATERAL (
+    SELECT li.created_at AS responded_at, li.trace_id
+    FROM lead_interactions li
+    WHERE li.lead_id = l.id
+    AND li.automated = true
+    AND li.interaction_type IN ('email_sent', 'sms_sent')
+    ORDER BY li.created_at
+    LIMIT 1
+) r ON true
+
+UNION ALL
+
+SELECT
+    e.occurred_at::date, l.service_type::text, l.source,
+    0, 0, 0, 0, 0, 0, 0, NULL, false,
+    e.sent, e.opened, e.clicked
+FROM (
+    SELECT lead_id, created_at AS occurred_at, 1 AS sent, 0 AS opened, 0 AS clicked
+    FROM lead_interactions WHERE interaction_type = 'email_sent'
+    UNION ALL
+    SELECT lead_id, email_opened_at, 0, 1, 0
+    FROM lead_interactions WHERE interaction_type = 'email_sent' AND email_opened_at IS NOT NULL
+    UNION ALL
+    SELECT lead_id, email_clicked_at, 0, 0, 1
+    FROM lead_interactions WHERE interaction_type = 'email_sent' AND email_clicked_at IS NOT NULL
+) e
+JOIN leads l ON l.id = e.lead_id;
+
+-- =====================================================
+-- ROLLUPS: overall ('all'), per service type, per source
+-- =====================================================
+
+CREATE TEMP TABLE backfill_rollup ON COMMIT DROP AS
+SELECT
+    metric_date,
+    CASE
+        WHEN GROUPING(service_type) = 0 THEN 'service_type'
+        WHEN GROUPING(source) = 0 THEN 'source'
+        ELSE 'all'
+    END AS dimension,
+    COALESCE(service_type, source, '') AS dimension_value,
+    SUM(leads_created) AS leads_created,
+    SUM(leads_contacted) AS leads_contacted,
+    SUM(leads_qualified) AS leads_qualified,
+    SUM(leads_converted) AS leads_converted,
+    COUNT(response_minutes) AS responses_measured,
+    COALESCE(SUM(response_minutes), 0) AS response_time_sum_minutes,
+    COUNT(*) FILTER (WHERE response_minutes <= 5) AS responses_under_5min,
+    ROUND(percentile_cont(0.50) WITHIN GROUP (ORDER BY response_minutes::float8)::numeric, 2) AS p50_response_time_minutes,
+    ROUND(percentile_cont(0.95) WITHIN GROUP (ORDER BY response_minutes::float8)::numeric, 2) AS p95_response_time_minutes,
+    ROUND(percentile_cont(0.99) WITHIN GROUP (ORDER BY response_minutes::float8)::numeric, 2) AS p99_response_time_minutes,
+    SUM(emails_sent) AS emails_sent,
+    SUM(emails_opened) AS emails_opened,
+    SUM(emails_clicked) AS emails_clicked,
+    SUM(estimated_pipeline_value) AS estimated_pipeline_value,
+    SUM(converted_revenue) AS converted_revenue,
+    SUM(weekend_leads_count) AS weekend_leads_count,
+    COUNT(*) FILTER (WHERE traced AND response_minutes IS NOT NULL) AS traced_responses,
+    COUNT(*) FILTER (WHERE traced AND response_minutes > 5) AS sla_violations,
+    SUM(leads_created) FILTER (WHERE service_type = 'corporate') AS corporate_leads,
+    SUM(leads_created) FILTER (WHERE service_type = 'airport') AS airport_leads,
+    SUM(leads_created) FILTER (WHERE service_type = 'wedding') AS wedding_leads,
+    SUM(leads_created) FILTER (WHERE service_type = 'hourly') AS hourly_leads,
+    SUM(leads_created) FILTER (WHERE service_type = 'events') AS events_leads
+FROM backfill_facts
+GROUP BY GROUPING SETS ((metric_date), (metric_date, service_type), (metric_date, source));
+
+-- Response-time digests in the TDigest.to_dict() format: one centroid per
+-- distinct (rounded) response time. The aggregator compresses them on its
+-- first merge into each row.
+CREATE TEMP TABLE backfill_digests ON COMMIT DROP AS
+SELECT
+    metric_date, dimension, dimension_value,
+    jsonb_build_object(
+        'compression', 100,
+        'min', MIN(response_minutes),
+        'max', MAX(response_minutes),
+        'centroids', jsonb_agg(jsonb_build_array(response_minutes, weight) ORDER BY response_minutes)
+    ) AS response_time_digest
+FROM (
+    SELECT
+        metric_date,
+        CASE
+            WHEN GROUPING(service_type) = 0 THEN 'service_type'
+            WHEN GROUPING(source) = 0 THEN 'source'
+            ELSE 'all'
+        END AS dimension,
+        COALESCE(service_type, source, '') AS dimension_value,
+        response_minutes,
+        COUNT(*) AS weight
+    FROM backfill_facts
+    WHERE response_minutes IS NOT NULL
+    GROUP BY GROUPING SETS (
+        (metric_date, response_minutes),
+        (metric_date, service_type, response_minutes),
+        (metric_date, source, response_minutes)
+    )
+) centroids
+GROUP BY metric_date, dimension, dimension_value;
+
+-- =====================================================
+-- WRITE
+-- =====================================================
+
+INSERT INTO daily_metrics (
+    metric_date, leads_created, leads_contacted, leads_qualified, leads_converted, conversion_rate,
+    avg_response_time_minutes, responses_measured, response_time_sum_minutes,
+    p50_response_time_minutes, p95_response_time_minutes, p99_response_time_minutes, response_time_digest,
+    responses_under_5min, traced_responses, sla_violations, weekend_leads_count,
+    emails_sent, emails_opened, emails_clicked, email_response_rate,
+    estimated_pipeline_value, converted_revenue, avg_deal_size,
+    corporate_leads, airport_leads, wedding_leads, hourly_leads, events_leads, calculated_at
+)
+SELECT
+    r.metric_date, r.leads_created, r.leads_contacted, r.leads_qualified, r.leads_converted,
+    ROUND(100.0 * r.leads_converted / NULLIF(r.leads_created, 0), 2),
+    ROUND(r.response_time_sum_minutes / NULLIF(r.responses_measured, 0), 2),
+    r.responses_measured, r.response_time_sum_minutes,
+    r.p50_response_time_minutes, r.p95_response_time_minutes, r.p99_response_time_minutes, d.response_time_digest,
+    r.responses_under_5min, r.traced_responses, r.sla_violations, r.weekend_leads_count,
+    r.emails_sent, r.emails_opened, r.emails_clicked,
+    ROUND(100.0 * r.emails_opened / NULLIF(r.emails_sent, 0), 2),
+    r.estimated_pipeline_value, r.converted_revenue,
+    ROUND(r.converted_revenue / NULLIF(r.leads_converted, 0), 2),
+    COALESCE(r.corporate_leads, 0), COALESCE(r.airport_leads, 0), COALESCE(r.wedding_leads, 0),
+    COALESCE(r.hourly_leads, 0), COALESCE(r.events_leads, 0),
+    CURRENT_TIMESTAMP
+FROM backfill_rollup r
+LEFT JOIN backfill_digests d USING (metric_date, dimension, dimension_value)
+WHERE r.dimension = 'all'
+ON CONFLICT (metric_date) DO UPDATE SET
+    leads_created = EXCLUDED.leads_created,
+    leads_contacted = EXCLUDED.leads_contacted,
+    leads_qualified = EXCLUDED.leads_qualified,
+    leads_converted = EXCLUDED.leads_converted,
+    conversion_rate = EXCLUDED.conversion_rate,
+    avg_response_time_minutes = EXCLUDED.avg_response_time_minutes,
+    responses_measured = EXCLUDED.responses_measured,
+    response_time_sum_minutes = EXCLUDED.response_time_sum_minutes,
+    p50_response_time_minutes = EXCLUDED.p50_response_time_minutes,
+    p95_response_time_minutes = EXCLUDED.p95_response_time_minutes,
+    p99_response_time_minutes = EXCLUDED.p99_response_time_minutes,
+    response_time_digest = EXCLUDED.response_time_digest,
+    responses_under_5min = EXCLUDED.responses_under_5min,
+    traced_responses = EXCLUDED.traced_responses,
+    sla_violations = EXCLUDED.sla_violations,
+    weekend_leads_count = EXCLUDED.weekend_leads_count,
+    emails_sent = EXCLUDED.emails_sent,
+    emails_opened = EXCLUDED.emails_opened,
+    emails_clicked = EXCLUDED.emails_clicked,
+    email_response_rate = EXCLUDED.email_response_rate,
+    estimated_pipeline_value = EXCLUDED.estimated_pipeline_value,
+    converted_revenue = EXCLUDED.converted_revenue,
+    avg_deal_size = EXCLUDED.avg_deal_size,
+    corporate_leads = EXCLUDED.corporate_leads,
+    airport_leads = EXCLUDED.airport_leads,
+    wedding_leads = EXCLUDED.wedding_leads,
+    hourly_leads = EXCLUDED.hourly_leads,
+    events_leads = EXCLUDED.events_leads,
+    calculated_at = CURRENT_TIMESTAMP;
+
+INSERT INTO daily_metrics_breakdown (
+    metric_date, dimension, dimension_value,
+    leads_created, leads_contacted, leads_qualified, leads_converted,
+    responses_measured, response_time_sum_minutes, responses_under_5min,
+    p50_response_time_minutes, p95_response_time_minutes, p99_response_time_minutes, response_time_digest,
+    emails_sent, emails_opened, emails_clicked,
+    estimated_pipeline_value, converted_revenue, calculated_at
+)
+SELECT
+    r.metric_date, r.dimension, r.dimension_value,
+    r.leads_created, r.leads_contacted, r.leads_qualified, r.leads_converted,
+    r.responses_measured, r.response_time_sum_minutes, r.responses_under_5min,
+    r.p50_response_time_minutes, r.p95_response_time_minutes, r.p99_response_time_minutes, d.response_time_digest,
+    r.emails_sent, r.emails_opened, r.emails_clicked,
+    r.estimated_pipeline_value, r.converted_revenue, CURRENT_TIMESTAMP
+FROM backfill_rollup r
+LEFT JOIN backfill_digests d USING (metric_date, dimension, dimension_value)
+WHERE r.dimension <> 'all'
+ON CONFLICT (metric_date, dimension, dimension_value) DO UPDATE SET
+    leads_created = EXCLUDED.leads_created,
+    leads_contacted = EXCLUDED.leads_contacted,
+    leads_qualified = EXCLUDED.leads_qualified,
+    leads_converted = EXCLUDED.leads_converted,
+    responses_measured = EXCLUDED.responses_measured,
+    response_time_sum_minutes = EXCLUDED.response_time_sum_minutes,
+    responses_under_5min = EXCLUDED.responses_under_5min,
+    p50_response_time_minutes = EXCLUDED.p50_response_time_minutes,
+    p95_response_time_minutes = EXCLUDED.p95_response_time_minutes,
+    p99_response_time_minutes = EXCLUDED.p99_response_time_minutes,
+    response_time_digest = EXCLUDED.response_time_digest,
+    emails_sent = EXCLUDED.emails_sent,
+    emails_opened = EXCLUDED.emails_opened,
+    emails_clicked = EXCLUDED.emails_clicked,
+    estimated_pipeline_value = EXCLUDED.estimated_pipeline_value,
+    converted_revenue = EXCLUDED.converted_revenue,
+    calculated_at = CURRENT_TIMESTAMP;
+
+COMMIT;
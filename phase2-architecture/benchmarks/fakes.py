@@ -0,0 +1,231 @@
+"""
+TNT Corporate Lead System - Local Integration Stand-ins
+Fake external services for load testing and benchmarks
+
+Every fake listens on localhost, applies a configurable latency/error
+profile per request and counts what it received:
+- FakeSMTPServer: SMTP sink that accepts (or rejects) messages at DATA
+- Zoho CRM, FastTrack InVision, Slack webhook and Twilio HTTP mocks
+
+Usage:
+    smtp = FakeSMTPServer(FaultProfile(latency_ms=30))
+    zoho = fake_zoho(FaultProfile(latency_ms=120, error_rate=0.01))
+    await smtp.start(); await zoho.start()
+    ...
+    await zoho.stop(); await smtp.stop()
+"""
+
+import asyncio
+import random
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+# =====================================================
+# FAULT INJECTION
+# =====================================================
+
+@dataclass
+class FaultProfile:
+    """Latency and error injection applied to every request a fake handles"""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+    rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.rng = random.Random(self.seed)
+
+    async def apply(self) -> bool:
+        """Sleep for the configured latency; returns True if this request should fail"""
+        delay_ms = self.latency_ms
+        if self.jitter_ms:
+            delay_ms = max(0.0, self.rng.gauss(self.latency_ms, self.jitter_ms))
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+        return self.rng.random() < self.error_rate
+
+@dataclass
+class FakeStats:
+    """Requests handled by a fake service"""
+    requests: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"requests": self.requests, "errors": self.errors}
+
+# =====================================================
+# HTTP MOCKS
+# =====================================================
+
+SLACK_WEBHOOK_PATH = "/services/T000/B000/fake"
+
+def twilio_messages_path(account_sid: str) -> str:
+    return f"/2010-04-01/Accounts/{account_sid}/Messages.json"
+
+# (method, path, success status, response body factory)
+Route = Tuple[str, str, int, Callable[[web.Request], Any]]
+
+class FakeHTTPService:
+    """Minimal aiohttp.web mock serving canned JSON responses"""
+
+    def __init__(self, name: str, routes: List[Route], profile: Optional[FaultProfile] = None):
+        self.name = name
+        self.profile = profile or FaultProfile()
+        self.stats = FakeStats()
+        self.url = ""
+        self._runner: Optional[web.AppRunner] = None
+
+        self.app = web.Application()
+        for method, path, status, body in routes:
+            self.app.router.add_route(method, path, self._make_handler(status, body))
+
+    def _make_handler(self, status: int, body: Callable[[web.Request], Any]):
+        async def handler(request: web.Request) -> web.StreamResponse:
+            await request.read()
+            self.stats.requests += 1
+            if await self.profile.apply():
+                self.stats.errors += 1
+                return web.json_response({"error": "injected failure"}, status=503)
+
+            payload = body(request)
+            if isinstance(payload, str):
+                return web.Response(text=payload, status=status)
+            return web.json_response(payload, status=status)
+        return handler
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+def fake_zoho(profile: Optional[FaultProfile] = None) -> FakeHTTPService:
+    """Zoho CRM v2 mock; point ZohoCRMConfig.base_url at `url + '/crm/v2'`"""
+    return FakeHTTPService("zoho_crm", [
+        ("POST", "/crm/v2/Leads", 201, lambda request: {"data": [{
+            "code": "SUCCESS",
+            "status": "success",
+            "details": {"id": str(uuid.uuid4().int)[:18]},
+        }]}),
+        ("GET", "/crm/v2/settings/modules", 200, lambda request: {"modules": [{"api_name": "Leads"}]}),
+    ], profile)
+
+def fake_fasttrack(profile: Optional[FaultProfile] = None) -> FakeHTTPService:
+    """FastTrack InVision mock; use `url` as FASTTRACK_API_ENDPOINT"""
+    return FakeHTTPService("fasttrack_invision", [
+        ("POST", "/customers", 201, lambda request: {"customer_id": uuid.uuid4().hex[:12]}),
+        ("POST", "/quotes", 201, lambda request: {"quote_id": uuid.uuid4().hex[:12], "status": "draft"}),
+        ("GET", "/health", 200, lambda request: {"status": "ok"}),
+    ], profile)
+
+def fake_slack(profile: Optional[FaultProfile] = None) -> FakeHTTPService:
+    """Slack incoming-webhook sink; use `url + SLACK_WEBHOOK_PATH` as SLACK_WEBHOOK_URL"""
+    return FakeHTTPService("slack", [
+        ("POST", SLACK_WEBHOOK_PATH, 200, lambda request: "ok"),
+    ], profile)
+
+def fake_twilio(profile: Optional[FaultProfile] = None) -> FakeHTTPService:
+    """Twilio Messages API mock; post to `url + twilio_messages_path(account_sid)`"""
+    return FakeHTTPService("sms_notifications", [
+        ("POST", "/2010-04-01/Accounts/{account_sid}/Messages.json", 201, lambda request: {
+            "sid": "SM" + uuid.uuid4().hex,
+            "account_sid": request.match_info["account_sid"],
+            "status": "queued",
+        }),
+    ], profile)
+
+# =====================================================
+# SMTP SINK
+# =====================================================
+
+class FakeSMTPServer:
+    """
+    Asyncio SMTP sink speaking just enough ESMTP for smtplib
+
+    Advertises AUTH PLAIN/LOGIN (any credentials succeed) and refuses
+    STARTTLS, so point RichWebSMTPConfig at it with use_tls=False. The
+    fault profile is applied when a message is accepted at end of DATA.
+    """
+
+    def __init__(self, profile: Optional[FaultProfile] = None):
+        self.profile = profile or FaultProfile()
+        self.stats = FakeStats()
+        self.messages_accepted = 0
+        self.host = "127.0.0.1"
+        self.port = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        self.host, self.port = self._server.sockets[0].getsockname()[:2]
+        return self.host, self.port
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def reply(line: str) -> None:
+            writer.write(line.encode() + b"\r\n")
+            await writer.drain()
+
+        try:
+            await reply("220 fake-smtp ESMTP ready")
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                command, _, argument = raw.decode(errors="replace").rstrip("\r\n").partition(" ")
+                command = command.upper()
+
+                if command == "EHLO":
+                    await reply("250-fake-smtp\r\n250-AUTH PLAIN LOGIN\r\n250 8BITMIME")
+                elif command in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                    await reply("250 OK")
+                elif command == "AUTH":
+                    mechanism = argument.split(" ", 1)[0].upper()
+                    if mechanism == "LOGIN":
+                        await reply("334 VXNlcm5hbWU6")
+                        await reader.readline()
+                        await reply("334 UGFzc3dvcmQ6")
+                        await reader.readline()
+                    elif mechanism == "PLAIN" and " " not in argument:
+                        await reply("334 ")
+                        await reader.readline()
+                    await reply("235 2.7.0 Authentication successful")
+                elif command == "STARTTLS":
+                    await reply("454 4.7.0 TLS not available")
+                elif command == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    while (await reader.readline()) not in (b".\r\n", b".\n", b""):
+                        pass
+                    self.stats.requests += 1
+                    if await self.profile.apply():
+                        self.stats.errors += 1
+                        await reply("451 4.3.0 Injected failure")
+                    else:
+                        self.messages_accepted += 1
+                        await reply("250 2.0.0 Queued")
+                elif command == "QUIT":
+                    await reply("221 2.0.0 Bye")
+                    break
+                else:
+                    await reply("502 5.5.2 Command not recognized")
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,119 @@
+"""
+TNT Corporate Lead System - Import-Time Benchmark
+Measures package import cost using `python -X importtime`
+
+Runs the import in a fresh interpreter (several times, keeping the fastest run)
+and reports the cumulative import time of the target plus its slowest
+dependencies. Also verifies that heavy optional dependencies are not loaded by
+a bare package import, so CLI tools, workers and serverless cold starts only
+pay for the integrations they actually use.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module integration_configs.manager --repeat 10
+    python benchmarks/import_time.py --statement "import integration_configs; integration_configs.IntegrationManager"
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+# Project root containing the integration_configs package
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported by a bare `import integration_configs`
+DEFAULT_FORBIDDEN_MODULES = [
+    "aiohttp",
+    "cryptography",
+    "smtplib",
+    "email.mime",
+]
+
+def measure_import(statement: str) -> Dict[str, int]:
+    """Run statement in a fresh interpreter and return cumulative import time (us) per module"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=PROJECT_ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import failed:\n{result.stderr}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative_us, module = line[len("import time:"):].split("|")
+        timings[module.strip()] = int(cumulative_us)
+
+    return timings
+
+def run_benchmark(statement: str, target: str, repeat: int, top: int,
+                  forbidden: List[str]) -> Dict[str, object]:
+    """Measure repeated imports and summarize the fastest run"""
+    runs = [measure_import(statement) for _ in range(repeat)]
+    best = min(runs, key=lambda timings: timings.get(target, sum(timings.values())))
+
+    slowest = sorted(best.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    loaded_forbidden = sorted(
+        module for module in best
+        if any(module == name or module.startswith(name + ".") for name in forbidden)
+    )
+
+    return {
+        "statement": statement,
+        "target": target,
+        "repeat": repeat,
+        "target_cumulative_us": best.get(target),
+        "target_cumulative_us_all_runs": [timings.get(target) for timings in runs],
+        "modules_imported": len(best),
+        "slowest_modules_us": dict(slowest),
+        "forbidden_modules_loaded": loaded_forbidden,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure integration_configs import time")
+    parser.add_argument("--module", default="integration_configs",
+                        help="Module to import and report on")
+    parser.add_argument("--statement", default=None,
+                        help="Custom statement to execute instead of 'import <module>'")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Number of fresh-interpreter runs (fastest is reported)")
+    parser.add_argument("--top", type=int, default=10,
+                        help="Number of slowest modules to list")
+    parser.add_argument("--forbid", action="append", default=None,
+                        help="Module that must not be imported (repeatable)")
+    parser.add_argument("--max-us", type=int, default=None,
+                        help="Fail if the target's cumulative import time exceeds this budget")
+    args = parser.parse_args(argv)
+
+    statement = args.statement or f"import {args.module}"
+    forbidden = DEFAULT_FORBIDDEN_MODULES if args.forbid is None else args.forbid
+
+    report = run_benchmark(statement, args.module, args.repeat, args.top, forbidden)
+    print(json.dumps(report, indent=2))
+
+    if report["forbidden_modules_loaded"]:
+        print(f"FAIL: heavy modules imported eagerly: {', '.join(report['forbidden_modules_loaded'])}",
+              file=sys.stderr)
+        return 1
+
+    if args.max_us is not None and (report["target_cumulative_us"] or 0) > args.max_us:
+        print(f"FAIL: {args.module} import took {report['target_cumulative_us']}us "
+              f"(budget {args.max_us}us)", file=sys.stderr)
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
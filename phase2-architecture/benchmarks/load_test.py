@@ -0,0 +1,424 @@
+"""
+TNT Corporate Lead System - Load Test and Benchmark Suite
+Replays synthetic lead streams through the integration paths against local fakes
+
+Starts an SMTP sink and Zoho, FastTrack, Slack and Twilio mocks (see fakes.py),
+points the integration configs at them, and drives synthetic leads (shaped like
+the sample lead in `python -m integration_configs`) at a fixed arrival rate:
+
+    ingest -> scoring -> format -> fanout.{crm,dispatch,slack,sms,email} -> smtp_accept
+
+Arrivals are open-loop: each lead's submission time is its scheduled arrival,
+so a slow system shows up as latency instead of silently lowering the rate.
+The report (throughput, per-stage tail latency, SLA violations, per-channel
+errors) is printed as JSON and can be saved or compared against a baseline.
+
+Usage:
+    python benchmarks/load_test.py --rate 50 --duration 30
+    python benchmarks/load_test.py --latency zoho=400 --error-rate slack=0.05
+    python benchmarks/load_test.py --save-baseline baseline.json
+    python benchmarks/load_test.py --baseline baseline.json --tolerance 0.15
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+# Make integration_configs importable when run as a script
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fakes import (  # noqa: E402
+    SLACK_WEBHOOK_PATH,
+    FakeSMTPServer,
+    FaultProfile,
+    fake_fasttrack,
+    fake_slack,
+    fake_twilio,
+    fake_zoho,
+    twilio_messages_path,
+)
+
+# Default per-service latency (ms), roughly matching production observations
+DEFAULT_LATENCY_MS: Dict[str, float] = {
+    "zoho": 120.0,
+    "fasttrack": 80.0,
+    "slack": 40.0,
+    "twilio": 60.0,
+    "smtp": 30.0,
+}
+
+SERVICES = tuple(DEFAULT_LATENCY_MS)
+
+# Report paths compared against a baseline: (path, higher_is_worse)
+BASELINE_CHECKS = [
+    (("throughput_leads_per_sec",), False),
+    (("stages", "total", "p50_ms"), True),
+    (("stages", "total", "p95_ms"), True),
+    (("stages", "total", "p99_ms"), True),
+    (("sla", "sla_violations"), True),
+    (("sla", "unanswered"), True),
+    (("error_rate",), True),
+]
+
+# =====================================================
+# SYNTHETIC LEADS
+# =====================================================
+
+COMPANIES = [
+    "Richmond Financial Group", "James River Capital", "Capitol Square Legal",
+    "Shockoe Bottom Ventures", "VCU Health Partners", "Dominion Tower Consulting",
+    None,  # Individual customers
+]
+FIRST_NAMES = ["Sarah", "Michael", "Priya", "James", "Elena", "David", "Aisha", "Robert"]
+LAST_NAMES = ["Johnson", "Chen", "Patel", "Williams", "Garcia", "Brown", "Okafor", "Miller"]
+SERVICE_TYPES = ["corporate", "airport", "wedding", "hourly", "events"]
+PICKUPS = [
+    "1401 E Broad St, Richmond, VA 23219",
+    "901 E Byrd St, Richmond, VA 23219",
+    "2000 Bremo Rd, Richmond, VA 23226",
+    "Short Pump Town Center, Richmond, VA 23233",
+]
+DESTINATIONS = [
+    "Richmond International Airport (RIC)",
+    "Washington Dulles International Airport (IAD)",
+    "The Jefferson Hotel, Richmond, VA",
+    "Virginia Museum of Fine Arts, Richmond, VA",
+]
+
+def synthetic_lead(rng: random.Random) -> Dict[str, Any]:
+    """Random lead with the same shape as the integration_configs sample lead"""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    company = rng.choice(COMPANIES)
+    domain = (company or f"{last}family").lower().replace(" ", "") + ".com"
+
+    lead = {
+        "lead_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "contact_name": f"{first} {last}",
+        "email": f"{first[0].lower()}.{last.lower()}@{domain}",
+        "phone": f"+1-804-555-{rng.randint(0, 9999):04d}",
+        "service_type": rng.choice(SERVICE_TYPES),
+        "estimated_value": round(rng.lognormvariate(6.2, 0.6), 2),  # median ~$500
+        "lead_score": rng.randint(10, 100),
+        "pickup_location": rng.choice(PICKUPS),
+        "destination": rng.choice(DESTINATIONS),
+        "passenger_count": rng.choice([1, 1, 2, 3, 4, 6, 10]),
+        "service_date": (datetime.utcnow() + timedelta(days=rng.randint(1, 60))).date().isoformat(),
+    }
+    if company:
+        lead["company_name"] = company
+    return lead
+
+# =====================================================
+# LOAD DRIVER
+# =====================================================
+
+def _fake_fernet_key() -> str:
+    """A well-formed Fernet key; the vault only builds its cipher on use"""
+    return base64.urlsafe_b64encode(os.urandom(32)).decode()
+
+class LoadDriver:
+    """Runs leads through the integration paths against the local fakes"""
+
+    def __init__(self, fakes: Dict[str, Any], smtp_workers: int, sla_seconds: float):
+        from integration_configs import IntegrationManager, get_integration_metrics
+        from integration_configs.tracing import LeadTracer
+
+        self.fakes = fakes
+        self.metrics = get_integration_metrics()
+        self.metrics.reset()
+        self.tracer = LeadTracer(capacity=100_000, sla_seconds=sla_seconds)
+        self.executor = ThreadPoolExecutor(max_workers=smtp_workers, thread_name_prefix="smtp")
+        self.channel_stats: Dict[str, Dict[str, int]] = {}
+        self.session: Optional[aiohttp.ClientSession] = None
+
+        smtp = fakes["smtp"]
+        os.environ.update({
+            "INTEGRATION_ENCRYPTION_KEY": os.getenv("INTEGRATION_ENCRYPTION_KEY") or _fake_fernet_key(),
+            "ZOHO_CLIENT_ID": "load-test",
+            "FASTTRACK_API_ENDPOINT": fakes["fasttrack"].url,
+            "FASTTRACK_API_KEY": "load-test",
+            "RICHWEB_SMTP_USERNAME": "load-test",
+            "RICHWEB_SMTP_PASSWORD": "load-test",
+            "SLACK_WEBHOOK_URL": fakes["slack"].url + SLACK_WEBHOOK_PATH,
+            "TWILIO_ACCOUNT_SID": "AC" + "0" * 32,
+            "TWILIO_FROM_NUMBER": "+18045550100",
+            "TNT_MANAGER_PHONE_1": "+18045550101",
+            "TNT_DASHBOARD_URL": "http://dashboard.invalid",
+            "TNT_API_URL": "http://api.invalid",
+        })
+
+        manager = IntegrationManager()
+        self.zoho = manager.get_integration("zoho_crm")
+        self.zoho.base_url = fakes["zoho"].url + "/crm/v2"
+        self.fasttrack = manager.get_integration("fasttrack")
+        self.smtp = manager.get_integration("richweb_smtp")
+        self.smtp.smtp_host, self.smtp.smtp_port, self.smtp.use_tls = smtp.host, smtp.port, False
+        self.slack = manager.get_integration("slack")
+        self.sms = manager.get_integration("sms")
+        self.twilio_url = fakes["twilio"].url + twilio_messages_path(self.sms.account_sid)
+
+    async def __aenter__(self) -> "LoadDriver":
+        connector = aiohttp.TCPConnector(limit=0)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30))
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.session.close()
+        self.executor.shutdown(wait=True)
+
+    # -------------------------------------------------
+    # Pipeline
+    # -------------------------------------------------
+
+    async def process_lead(self, lead: Dict[str, Any], submitted_at: float) -> None:
+        lead_id = lead["lead_id"]
+        self.tracer.start_trace(lead_id, submitted_at=submitted_at,
+                                service_type=lead.get("service_type"), source=lead.get("source", "Website"))
+        try:
+            with self.tracer.span(lead_id, "ingest"):
+                lead = dict(lead, source=lead.get("source", "Website"))
+
+            with self.tracer.span(lead_id, "scoring"):
+                lead["priority"] = self.zoho._calculate_priority(lead["lead_score"])
+
+            with self.tracer.span(lead_id, "format"):
+                zoho_payload = self.zoho.format_lead_for_zoho(lead)
+                customer = self.fasttrack.format_customer_for_fasttrack(lead)
+                quote = self.fasttrack.create_trip_quote(lead)
+                slack_payload = self.slack.format_lead_notification(lead)
+                sms_body = self.sms.format_lead_alert(lead)
+                email = self.smtp.create_email_message(
+                    lead["email"],
+                    "Your TNT Limousine quote request",
+                    f"Hi {lead['contact_name']}, thanks for contacting TNT Limousine.",
+                    "<html><body><p>Thanks for contacting TNT Limousine.</p></body></html>",
+                    tracking_id=lead_id,
+                )
+
+            deliveries = {
+                "email": self._send_email(lead_id, email),
+                "crm": self._post(self.zoho.service_name, f"{self.zoho.base_url}/Leads",
+                                  json=zoho_payload, headers=self.zoho.get_headers("load-test")),
+                "dispatch": self._post_fasttrack(customer, quote),
+                "slack": self._post(self.slack.service_name, self.slack.webhook_url, json=slack_payload),
+            }
+            if lead["estimated_value"] >= self.sms.high_value_threshold:
+                deliveries["sms"] = self._send_sms(sms_body)
+
+            await asyncio.gather(*(
+                self._fanout(lead_id, channel, delivery) for channel, delivery in deliveries.items()
+            ))
+        finally:
+            self.tracer.finish_trace(lead_id)
+
+    async def _fanout(self, lead_id: str, channel: str, delivery) -> None:
+        stats = self.channel_stats.setdefault(channel, {"sent": 0, "errors": 0})
+        try:
+            async with self.tracer.span(lead_id, "fanout", channel=channel):
+                await delivery
+            stats["sent"] += 1
+        except Exception:
+            stats["errors"] += 1
+
+    async def _send_email(self, lead_id: str, message) -> None:
+        loop = asyncio.get_running_loop()
+        async with self.tracer.span(lead_id, "smtp_accept"):
+            await loop.run_in_executor(self.executor, self.smtp.send_email, message)
+
+    async def _post(self, service: str, url: str, **kwargs: Any) -> None:
+        async with self.metrics.track(service, "send"):
+            async with self.session.post(url, **kwargs) as response:
+                await response.read()
+                response.raise_for_status()
+
+    async def _post_fasttrack(self, customer: Dict[str, Any], quote: Dict[str, Any]) -> None:
+        headers = self.fasttrack.get_headers()
+        await self._post(self.fasttrack.service_name, f"{self.fasttrack.api_endpoint}/customers",
+                         json=customer, headers=headers)
+        await self._post(self.fasttrack.service_name, f"{self.fasttrack.api_endpoint}/quotes",
+                         json=quote, headers=headers)
+
+    async def _send_sms(self, body: str) -> None:
+        credentials = f"{self.sms.account_sid}:{self.sms.auth_token or 'load-test'}"
+        headers = {"Authorization": "Basic " + base64.b64encode(credentials.encode()).decode()}
+        for number in self.sms.manager_numbers:
+            data = {"From": self.sms.from_number, "To": number, "Body": body}
+            await self._post(self.sms.service_name, self.twilio_url, data=data, headers=headers)
+
+# =====================================================
+# RUNNER
+# =====================================================
+
+async def run_load_test(args: argparse.Namespace) -> Dict[str, Any]:
+    """Start fakes, replay the synthetic stream and build the JSON report"""
+    profiles = {
+        service: FaultProfile(
+            latency_ms=args.latency.get(service, DEFAULT_LATENCY_MS[service]),
+            jitter_ms=args.latency.get(service, DEFAULT_LATENCY_MS[service]) * args.jitter,
+            error_rate=args.error_rate.get(service, 0.0),
+            seed=None if args.seed is None else args.seed + index,
+        )
+        for index, service in enumerate(SERVICES)
+    }
+    fakes: Dict[str, Any] = {
+        "zoho": fake_zoho(profiles["zoho"]),
+        "fasttrack": fake_fasttrack(profiles["fasttrack"]),
+        "slack": fake_slack(profiles["slack"]),
+        "twilio": fake_twilio(profiles["twilio"]),
+        "smtp": FakeSMTPServer(profiles["smtp"]),
+    }
+    for fake in fakes.values():
+        await fake.start()
+
+    rng = random.Random(args.seed)
+    total_leads = args.leads or int(args.rate * args.duration)
+    in_flight = asyncio.Semaphore(args.max_in_flight)
+
+    try:
+        async with LoadDriver(fakes, args.smtp_workers, args.sla_seconds) as driver:
+            async def run_one(lead: Dict[str, Any], submitted_at: float) -> None:
+                async with in_flight:
+                    await driver.process_lead(lead, submitted_at)
+
+            tasks: List[asyncio.Task] = []
+            start_monotonic = time.perf_counter()
+            start_wall = time.time()
+            for index in range(total_leads):
+                offset = index / args.rate
+                delay = offset - (time.perf_counter() - start_monotonic)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                lead = synthetic_lead(rng)
+                tasks.append(asyncio.create_task(run_one(lead, start_wall + offset)))
+
+            await asyncio.gather(*tasks)
+            elapsed = time.perf_counter() - start_monotonic
+
+            sent = sum(stats["sent"] for stats in driver.channel_stats.values())
+            errors = sum(stats["errors"] for stats in driver.channel_stats.values())
+            return {
+                "config": {
+                    "rate_leads_per_sec": args.rate,
+                    "leads": total_leads,
+                    "max_in_flight": args.max_in_flight,
+                    "sla_seconds": args.sla_seconds,
+                    "latency_ms": {service: profile.latency_ms for service, profile in profiles.items()},
+                    "error_rate": {service: profile.error_rate for service, profile in profiles.items()},
+                    "seed": args.seed,
+                },
+                "duration_seconds": round(elapsed, 3),
+                "throughput_leads_per_sec": round(total_leads / elapsed, 2) if elapsed else None,
+                "error_rate": round(errors / (sent + errors), 4) if sent + errors else 0.0,
+                "sla": driver.tracer.sla_report(),
+                "stages": driver.tracer.stage_percentiles(),
+                "channels": driver.channel_stats,
+                "integrations": driver.metrics.snapshot(),
+                "fakes": {name: fake.stats.to_dict() for name, fake in fakes.items()},
+            }
+    finally:
+        for fake in fakes.values():
+            await fake.stop()
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float) -> List[Dict[str, Any]]:
+    """Return the checks where report is worse than baseline by more than tolerance"""
+    regressions = []
+    for path, higher_is_worse in BASELINE_CHECKS:
+        current, previous = _lookup(report, path), _lookup(baseline, path)
+        if current is None or previous is None:
+            continue
+
+        if higher_is_worse:
+            limit = previous * (1 + tolerance)
+            regressed = current > limit and current > previous
+        else:
+            limit = previous * (1 - tolerance)
+            regressed = current < limit
+
+        if regressed:
+            regressions.append({
+                "metric": ".".join(path),
+                "baseline": previous,
+                "current": current,
+                "limit": round(limit, 4),
+            })
+    return regressions
+
+def _lookup(data: Dict[str, Any], path) -> Optional[float]:
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+def _service_values(values: List[str], option: str) -> Dict[str, float]:
+    """Parse repeated SERVICE=VALUE options"""
+    parsed = {}
+    for item in values:
+        service, _, value = item.partition("=")
+        if service not in SERVICES or not value:
+            raise SystemExit(f"{option} expects SERVICE=VALUE with SERVICE in {', '.join(SERVICES)}")
+        parsed[service] = float(value)
+    return parsed
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the TNT integration paths against local fakes")
+    parser.add_argument("--rate", type=float, default=20.0, help="Lead arrival rate (leads/sec)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Test duration in seconds")
+    parser.add_argument("--leads", type=int, default=None, help="Total leads (overrides --duration)")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="Cap on concurrently processed leads")
+    parser.add_argument("--smtp-workers", type=int, default=16, help="Threads for blocking SMTP sends")
+    parser.add_argument("--sla-seconds", type=float, default=300.0, help="Speed-to-lead SLA")
+    parser.add_argument("--latency", action="append", default=[], metavar="SERVICE=MS",
+                        help=f"Fake latency per service ({', '.join(SERVICES)})")
+    parser.add_argument("--error-rate", action="append", default=[], metavar="SERVICE=RATE",
+                        help="Fake error rate (0-1) per service")
+    parser.add_argument("--jitter", type=float, default=0.25,
+                        help="Latency standard deviation as a fraction of the mean")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible streams")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this path")
+    parser.add_argument("--save-baseline", default=None, help="Save this run as the baseline")
+    parser.add_argument("--baseline", default=None, help="Compare against a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed relative regression versus the baseline")
+    args = parser.parse_args(argv)
+    args.latency = _service_values(args.latency, "--latency")
+    args.error_rate = _service_values(args.error_rate, "--error-rate")
+
+    report = asyncio.run(run_load_test(args))
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(report, json.load(f), args.tolerance)
+        report["baseline_comparison"] = {
+            "baseline": args.baseline,
+            "tolerance": args.tolerance,
+            "regressions": regressions,
+        }
+        if regressions:
+            exit_code = 1
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, "w") as f:
+            f.write(output + "\n")
+
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -118,6 +118,10 @@ CREATE TABLE lead_interactions (
     response_content TEXT,
     next_action VARCHAR(255),
 
+    -- Speed-to-Lead Tracing
+    trace_id VARCHAR(32), -- OpenTelemetry trace ID of the automated response pipeline
+    stage_timings JSONB, -- Per-stage latency in ms, e.g. {"ingest": 12.4, "fanout.email": 830.1}
+
     -- Metadata
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     scheduled_for TIMESTAMP, -- For future scheduled interactions
@@ -278,13 +282,22 @@ CREATE TABLE daily_metrics (
 
     -- Lead Metrics
     leads_created INTEGER DEFAULT 0,
+    leads_contacted INTEGER DEFAULT 0,
     leads_qualified INTEGER DEFAULT 0,
     leads_converted INTEGER DEFAULT 0,
     conversion_rate DECIMAL(5,2),
 
     -- Response Metrics
     avg_response_time_minutes DECIMAL(8,2),
+    responses_measured INTEGER DEFAULT 0, -- Leads with a recorded first automated response
+    response_time_sum_minutes DECIMAL(12,2) DEFAULT 0,
+    p50_response_time_minutes DECIMAL(8,2),
+    p95_response_time_minutes DECIMAL(8,2),
+    p99_response_time_minutes DECIMAL(8,2),
+    response_time_digest JSONB, -- Mergeable t-digest of response times (minutes)
     responses_under_5min INTEGER DEFAULT 0,
+    traced_responses INTEGER DEFAULT 0, -- Responses measured by the pipeline tracer
+    sla_violations INTEGER DEFAULT 0, -- Traced leads answered after 5 minutes or never answered
     weekend_leads_count INTEGER DEFAULT 0,
 
     -- Email Metrics
@@ -294,8 +307,8 @@ CREATE TABLE daily_metrics (
     email_response_rate DECIMAL(5,2),
 
     -- Revenue Metrics
-    estimated_pipeline_value DECIMAL(12,2),
-    converted_revenue DECIMAL(12,2),
+    estimated_pipeline_value DECIMAL(12,2) DEFAULT 0,
+    converted_revenue DECIMAL(12,2) DEFAULT 0,
     avg_deal_size DECIMAL(10,2),
 
     -- Service Type Breakdown
@@ -303,13 +316,52 @@ CREATE TABLE daily_metrics (
     airport_leads INTEGER DEFAULT 0,
     wedding_leads INTEGER DEFAULT 0,
     hourly_leads INTEGER DEFAULT 0,
+    events_leads INTEGER DEFAULT 0,
 
-    -- Calculated at end of day
+    -- Last incremental update from the metrics aggregator
     calculated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX idx_metrics_date ON daily_metrics (metric_date DESC);
 
+-- Per-day metrics broken down by service type and lead source
+CREATE TABLE daily_metrics_breakdown (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    metric_date DATE NOT NULL,
+    dimension VARCHAR(20) NOT NULL, -- 'service_type', 'source'
+    dimension_value VARCHAR(100) NOT NULL,
+
+    -- Lead Metrics
+    leads_created INTEGER DEFAULT 0,
+    leads_contacted INTEGER DEFAULT 0,
+    leads_qualified INTEGER DEFAULT 0,
+    leads_converted INTEGER DEFAULT 0,
+
+    -- Response Metrics
+    responses_measured INTEGER DEFAULT 0,
+    response_time_sum_minutes DECIMAL(12,2) DEFAULT 0,
+    responses_under_5min INTEGER DEFAULT 0,
+    p50_response_time_minutes DECIMAL(8,2),
+    p95_response_time_minutes DECIMAL(8,2),
+    p99_response_time_minutes DECIMAL(8,2),
+    response_time_digest JSONB,
+
+    -- Email Metrics
+    emails_sent INTEGER DEFAULT 0,
+    emails_opened INTEGER DEFAULT 0,
+    emails_clicked INTEGER DEFAULT 0,
+
+    -- Revenue Metrics
+    estimated_pipeline_value DECIMAL(12,2) DEFAULT 0,
+    converted_revenue DECIMAL(12,2) DEFAULT 0,
+
+    calculated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    UNIQUE (metric_date, dimension, dimension_value)
+);
+
+CREATE INDEX idx_metrics_breakdown_date ON daily_metrics_breakdown (metric_date DESC, dimension);
+
 -- Lead scoring factors and weights
 CREATE TABLE scoring_factors (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -609,40 +661,32 @@ AND (l.lead_score >= 60 OR l.estimated_value >= 1000)
 ORDER BY l.lead_score DESC, l.created_at ASC;
 
 -- Lead conversion funnel metrics
+-- Reads the incrementally maintained daily_metrics (one row per day) instead
+-- of scanning leads; counts are by lead creation date, as before.
 CREATE VIEW conversion_funnel AS
 SELECT
-    DATE_TRUNC('day', created_at) AS date,
-    COUNT(*) AS total_leads,
-    COUNT(*) FILTER (WHERE status IN ('contacted', 'qualified', 'converted')) AS contacted,
-    COUNT(*) FILTER (WHERE status IN ('qualified', 'converted')) AS qualified,
-    COUNT(*) FILTER (WHERE status = 'converted') AS converted,
-    ROUND(
-        100.0 * COUNT(*) FILTER (WHERE status = 'converted') /
-        NULLIF(COUNT(*), 0), 2
-    ) AS conversion_rate
-FROM leads
-WHERE created_at >= CURRENT_DATE - INTERVAL '30 days'
-GROUP BY DATE_TRUNC('day', created_at)
+    metric_date::timestamp AS date,
+    leads_created AS total_leads,
+    leads_contacted AS contacted,
+    leads_qualified AS qualified,
+    leads_converted AS converted,
+    ROUND(100.0 * leads_converted / NULLIF(leads_created, 0), 2) AS conversion_rate
+FROM daily_metrics
+WHERE metric_date >= CURRENT_DATE - INTERVAL '30 days'
 ORDER BY date DESC;
 
 -- Response time performance
 CREATE VIEW response_time_metrics AS
 SELECT
-    DATE_TRUNC('day', l.created_at) AS date,
-    COUNT(*) AS total_leads,
-    COUNT(li.id) AS responded_leads,
-    ROUND(AVG(EXTRACT(EPOCH FROM (li.created_at - l.created_at))/60), 2) AS avg_response_minutes,
-    COUNT(*) FILTER (WHERE EXTRACT(EPOCH FROM (li.created_at - l.created_at))/60 <= 5) AS under_5_minutes,
-    ROUND(
-        100.0 * COUNT(*) FILTER (WHERE EXTRACT(EPOCH FROM (li.created_at - l.created_at))/60 <= 5) /
-        NULLIF(COUNT(*), 0), 2
-    ) AS under_5_minutes_rate
-FROM leads l
-LEFT JOIN lead_interactions li ON l.id = li.lead_id
-    AND li.interaction_type = 'email_sent'
-    AND li.automated = true
-WHERE l.created_at >= CURRENT_DATE - INTERVAL '30 days'
-GROUP BY DATE_TRUNC('day', l.created_at)
+    metric_date::timestamp AS date,
+    leads_created AS total_leads,
+    responses_measured AS responded_leads,
+    ROUND(response_time_sum_minutes / NULLIF(responses_measured, 0), 2) AS avg_response_minutes,
+    p95_response_time_minutes AS p95_response_minutes,
+    responses_under_5min AS under_5_minutes,
+    ROUND(100.0 * responses_under_5min / NULLIF(leads_created, 0), 2) AS under_5_minutes_rate
+FROM daily_metrics
+WHERE metric_date >= CURRENT_DATE - INTERVAL '30 days'
 ORDER BY date DESC;
 
 -- =====================================================
@@ -652,38 +696,35 @@ ORDER BY date DESC;
 -- Analyze queries for optimization
 ANALYZE;
 
--- Create materialized view for dashboard metrics (refresh daily)
-CREATE MATERIALIZED VIEW dashboard_summary AS
+-- Dashboard metrics summed from daily_metrics (O(days) rows, no refresh needed)
+CREATE VIEW dashboard_summary AS
 SELECT
     -- Today's metrics
-    COUNT(*) FILTER (WHERE DATE(created_at) = CURRENT_DATE) AS leads_today,
-    COUNT(*) FILTER (WHERE DATE(created_at) = CURRENT_DATE AND status = 'converted') AS conversions_today,
-    SUM(estimated_value) FILTER (WHERE DATE(created_at) = CURRENT_DATE AND status = 'converted') AS revenue_today,
+    COALESCE(SUM(leads_created) FILTER (WHERE metric_date = CURRENT_DATE), 0) AS leads_today,
+    COALESCE(SUM(leads_converted) FILTER (WHERE metric_date = CURRENT_DATE), 0) AS conversions_today,
+    SUM(converted_revenue) FILTER (WHERE metric_date = CURRENT_DATE) AS revenue_today,
 
     -- This week's metrics
-    COUNT(*) FILTER (WHERE created_at >= DATE_TRUNC('week', CURRENT_DATE)) AS leads_this_week,
-    COUNT(*) FILTER (WHERE created_at >= DATE_TRUNC('week', CURRENT_DATE) AND status = 'converted') AS conversions_this_week,
+    COALESCE(SUM(leads_created) FILTER (WHERE metric_date >= DATE_TRUNC('week', CURRENT_DATE)), 0) AS leads_this_week,
+    COALESCE(SUM(leads_converted) FILTER (WHERE metric_date >= DATE_TRUNC('week', CURRENT_DATE)), 0) AS conversions_this_week,
 
     -- This month's metrics
-    COUNT(*) FILTER (WHERE created_at >= DATE_TRUNC('month', CURRENT_DATE)) AS leads_this_month,
-    COUNT(*) FILTER (WHERE created_at >= DATE_TRUNC('month', CURRENT_DATE) AND status = 'converted') AS conversions_this_month,
-    SUM(estimated_value) FILTER (WHERE created_at >= DATE_TRUNC('month', CURRENT_DATE) AND status = 'converted') AS revenue_this_month,
+    COALESCE(SUM(leads_created) FILTER (WHERE metric_date >= DATE_TRUNC('month', CURRENT_DATE)), 0) AS leads_this_month,
+    COALESCE(SUM(leads_converted) FILTER (WHERE metric_date >= DATE_TRUNC('month', CURRENT_DATE)), 0) AS conversions_this_month,
+    SUM(converted_revenue) FILTER (WHERE metric_date >= DATE_TRUNC('month', CURRENT_DATE)) AS revenue_this_month,
 
     -- Overall metrics
-    COUNT(*) AS total_leads,
-    COUNT(*) FILTER (WHERE status = 'converted') AS total_conversions,
-    ROUND(100.0 * COUNT(*) FILTER (WHERE status = 'converted') / NULLIF(COUNT(*), 0), 2) AS overall_conversion_rate,
-
-    -- Generated timestamp
-    CURRENT_TIMESTAMP AS last_updated
-FROM leads;
+    COALESCE(SUM(leads_created), 0) AS total_leads,
+    COALESCE(SUM(leads_converted), 0) AS total_conversions,
+    ROUND(100.0 * SUM(leads_converted) / NULLIF(SUM(leads_created), 0), 2) AS overall_conversion_rate,
 
--- Create index on materialized view
-CREATE UNIQUE INDEX idx_dashboard_summary_last_updated ON dashboard_summary (last_updated);
+    -- Time of the most recent incremental update
+    MAX(calculated_at) AS last_updated
+FROM daily_metrics;
 
 COMMENT ON DATABASE tnt_lead_system IS 'TNT Corporate Lead Automation System - Phase 2 Database Schema';
 COMMENT ON TABLE leads IS 'Primary lead tracking with comprehensive business intelligence';
 COMMENT ON TABLE lead_interactions IS 'All customer touchpoints and engagement tracking';
 COMMENT ON TABLE automated_responses IS 'Email templates and automation sequences';
 COMMENT ON TABLE webhook_logs IS 'Integration event logs for debugging and replay';
-COMMENT ON MATERIALIZED VIEW dashboard_summary IS 'Pre-calculated dashboard metrics for performance';
\ No newline at end of file
+COMMENT ON VIEW dashboard_summary IS 'Dashboard metrics rolled up from incrementally maintained daily_metrics';
\ No newline at end of file
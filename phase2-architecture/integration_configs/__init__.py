@@ -0,0 +1,123 @@
+"""
+TNT Corporate Lead System - Integration Configurations
+Phase 2 Architecture - External System Connection Specifications
+
+This package contains configuration classes and utilities for integrating with:
+- FastTrack InVision (Dispatch Software)
+- Zoho CRM (Customer Relationship Management)
+- richweb.net SMTP (Email Automation)
+- Slack (Team Notifications)
+- SMS Gateway (Manager Alerts)
+
+Public names are resolved lazily (PEP 562) so that importing the package does
+not pull in aiohttp, cryptography or the email/SMTP stack. A process only pays
+for the integrations it actually touches.
+
+Author: TNT Limousine System Architecture
+Generated using architect-mcp.json specifications
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .aggregator import MetricsAggregator
+    from .base import IntegrationConfig, IntegrationType, SyncFrequency
+    from .fasttrack import FastTrackConfig
+    from .manager import IntegrationManager
+    from .metrics import (
+        IntegrationMetrics,
+        get_integration_metrics,
+        instrumented,
+        start_metrics_server,
+    )
+    from .richweb_smtp import RichWebSMTPConfig
+    from .shared_state import (
+        LocalStateBackend,
+        RedisStateBackend,
+        SharedStateBackend,
+        create_state_backend,
+    )
+    from .slack import SlackConfig
+    from .sms import SMSConfig
+    from .tdigest import TDigest
+    from .tracing import LeadTracer, TraceBatchExporter, get_lead_tracer
+    from .utils import (
+        decrypt_sensitive_data,
+        encrypt_sensitive_data,
+        validate_environment_variables,
+    )
+    from .vault import CredentialVault, get_credential_vault, reset_credential_vault
+    from .workers import DeliveryJob, WorkerContext, WorkerPool, shard_for_lead
+    from .zoho_crm import ZohoCRMConfig
+
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    # Configuration classes
+    "IntegrationType": "base",
+    "SyncFrequency": "base",
+    "IntegrationConfig": "base",
+    "ZohoCRMConfig": "zoho_crm",
+    "FastTrackConfig": "fasttrack",
+    "RichWebSMTPConfig": "richweb_smtp",
+    "SlackConfig": "slack",
+    "SMSConfig": "sms",
+
+    # Integration manager
+    "IntegrationManager": "manager",
+
+    # Worker runtime and shared state
+    "WorkerPool": "workers",
+    "WorkerContext": "workers",
+    "DeliveryJob": "workers",
+    "shard_for_lead": "workers",
+    "SharedStateBackend": "shared_state",
+    "LocalStateBackend": "shared_state",
+    "RedisStateBackend": "shared_state",
+    "create_state_backend": "shared_state",
+
+    # Instrumentation
+    "IntegrationMetrics": "metrics",
+    "get_integration_metrics": "metrics",
+    "instrumented": "metrics",
+    "start_metrics_server": "metrics",
+
+    # Speed-to-lead tracing
+    "LeadTracer": "tracing",
+    "TraceBatchExporter": "tracing",
+    "get_lead_tracer": "tracing",
+
+    # Incremental dashboard metrics
+    "MetricsAggregator": "aggregator",
+    "TDigest": "tdigest",
+
+    # Credential vault
+    "CredentialVault": "vault",
+    "get_credential_vault": "vault",
+    "reset_credential_vault": "vault",
+
+    # Utility functions
+    "encrypt_sensitive_data": "utils",
+    "decrypt_sensitive_data": "utils",
+    "validate_environment_variables": "utils",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """Import the defining submodule on first access to a public name"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
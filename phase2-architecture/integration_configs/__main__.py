@@ -0,0 +1,71 @@
+"""
+Example usage and testing of integration configurations
+
+Run with: python -m integration_configs
+"""
+
+from .manager import IntegrationManager
+from .utils import validate_environment_variables
+
+# =====================================================
+# EXAMPLE USAGE
+# =====================================================
+
+if __name__ == "__main__":
+
+    # Validate environment setup
+    env_validation = validate_environment_variables()
+    print("Environment Validation Results:")
+    for var, is_set in env_validation.items():
+        status = "✓" if is_set else "✗"
+        print(f"  {status} {var}")
+
+    # Initialize integration manager
+    try:
+        manager = IntegrationManager()
+        configured = manager.configured_services()
+        print(f"\nConfigured {len(configured)} integrations:")
+        for service_name in configured:
+            print(f"  • {service_name}")
+
+        # Get sync schedule
+        schedule = manager.get_sync_schedule()
+        print("\nSync Schedule:")
+        for frequency, services in schedule.items():
+            if services:
+                print(f"  {frequency}: {', '.join(services)}")
+
+        # Example lead data
+        sample_lead = {
+            "lead_id": "550e8400-e29b-41d4-a716-446655440000",
+            "company_name": "Richmond Financial Group",
+            "contact_name": "Sarah Johnson",
+            "email": "s.johnson@richmondfinancial.com",
+            "phone": "+1-804-555-0123",
+            "service_type": "corporate",
+            "estimated_value": 1200.00,
+            "lead_score": 85,
+            "pickup_location": "1401 E Broad St, Richmond, VA 23219",
+            "destination": "Richmond International Airport (RIC)",
+            "passenger_count": 3
+        }
+
+        # Test Zoho CRM formatting
+        zoho_config = manager.get_integration('zoho_crm')
+        if zoho_config is not None:
+            zoho_formatted = zoho_config.format_lead_for_zoho(sample_lead)
+            print(f"\nZoho CRM Format Preview:")
+            print(f"  Company: {zoho_formatted['data'][0].get('Company')}")
+            print(f"  Priority: {zoho_formatted['data'][0].get('Lead_Priority__c')}")
+
+        # Test Slack notification formatting
+        slack_config = manager.get_integration('slack')
+        if slack_config is not None:
+            slack_message = slack_config.format_lead_notification(sample_lead)
+            print(f"\nSlack Notification Preview:")
+            print(f"  Channel: {slack_message['channel']}")
+            print(f"  Title: {slack_message['attachments'][0]['title']}")
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        print("Please check your environment variable configuration.")
@@ -0,0 +1,445 @@
+"""
+Incremental metrics aggregator - maintains daily_metrics from lead events
+
+Replaces full scans of leads/lead_interactions (and full refreshes of the old
+dashboard_summary materialized view) with running aggregates:
+
+- Lead and interaction events update in-memory per-day aggregates, overall
+  and per service type / per source.
+- Response times go into mergeable t-digests for p50/p95/p99.
+- flush() upserts only the deltas accumulated since the last flush into
+  daily_metrics and daily_metrics_breakdown, so several processes can
+  aggregate side by side.
+
+Dashboard views (conversion_funnel, response_time_metrics, dashboard_summary)
+then read O(days) rows instead of O(leads).
+
+Usage:
+    aggregator = MetricsAggregator(connection)
+    aggregator.start(interval_seconds=60)
+
+    aggregator.record_lead_created(lead)
+    aggregator.record_lead_status_change(lead, "new", "contacted")
+    aggregator.record_interaction("email_opened", lead=lead)
+    aggregator.record_response(lead, responded_at)
+
+    aggregator.stop()  # final flush
+
+Where the event hooks must be called (any write path that skips one leaves
+the dashboards short):
+- record_lead_created: after the leads INSERT (POST /leads,
+  /webhooks/form-submission)
+- record_lead_status_change: after any UPDATE of leads.status
+  (PUT /leads/{leadId}, /webhooks/crm-updates), with the old status
+- record_interaction: after inserting an email_sent lead_interaction and
+  on open/click events (/webhooks/email-engagement)
+- record_response: once per untraced lead, when its first automated
+  email/SMS is accepted
+- record_trace: registered on the tracer (below); counts the response and
+  every email_sent row the TraceBatchExporter writes for the trace, so
+  traced sends need no record_interaction("email_sent") call
+
+Existing history is loaded once with backfill-daily-metrics.sql before
+the aggregator starts.
+
+Traced responses: register both exporters on the tracer. The
+TraceBatchExporter is the single writer of the automated email_sent/sms_sent
+lead_interactions rows for traced leads, and the aggregator owns
+daily_metrics (the exporter leaves it alone unless write_daily_metrics=True):
+
+    exporter = TraceBatchExporter(connection)
+    exporter.start()  # writes batches off the lead-processing thread
+    tracer.add_exporter(exporter)
+    tracer.add_exporter(aggregator.record_trace)
+"""
+
+import json
+import logging
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .tdigest import TDigest
+
+logger = logging.getLogger(__name__)
+
+SLA_MINUTES = 5.0
+
+# Dimension used for the overall daily_metrics row
+DIMENSION_ALL = "all"
+DIMENSION_SERVICE_TYPE = "service_type"
+DIMENSION_SOURCE = "source"
+
+# Funnel columns a lead counts towards in each status (matches the original
+# conversion_funnel view: a lost lead drops out of every stage)
+FUNNEL_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "new": (),
+    "contacted": ("leads_contacted",),
+    "qualified": ("leads_contacted", "leads_qualified"),
+    "converted": ("leads_contacted", "leads_qualified", "leads_converted"),
+    "lost": (),
+}
+
+# Counters shared by daily_metrics and daily_metrics_breakdown
+COUNTER_COLUMNS = (
+    "leads_created", "leads_contacted", "leads_qualified", "leads_converted",
+    "responses_measured", "response_time_sum_minutes", "responses_under_5min",
+    "emails_sent", "emails_opened", "emails_clicked",
+    "estimated_pipeline_value", "converted_revenue",
+)
+
+# Counters that only exist on daily_metrics
+DAILY_ONLY_COLUMNS = (
+    "weekend_leads_count", "traced_responses", "sla_violations",
+    "corporate_leads", "airport_leads", "wedding_leads", "hourly_leads", "events_leads",
+)
+
+# Ratios recomputed from the merged counters after each upsert
+DAILY_DERIVED_SQL = """,
+    conversion_rate = ROUND(100.0 * leads_converted / NULLIF(leads_created, 0), 2),
+    avg_response_time_minutes = ROUND(response_time_sum_minutes / NULLIF(responses_measured, 0), 2),
+    email_response_rate = ROUND(100.0 * emails_opened / NULLIF(emails_sent, 0), 2),
+    avg_deal_size = ROUND(converted_revenue / NULLIF(leads_converted, 0), 2)"""
+
+EMAIL_COUNTERS = {
+    "email_sent": "emails_sent",
+    "email_opened": "emails_opened",
+    "email_clicked": "emails_clicked",
+}
+
+Timestamp = Union[datetime, date, str, None]
+BucketKey = Tuple[date, str, str]  # (metric_date, dimension, dimension_value)
+
+# =====================================================
+# AGGREGATE BUCKET
+# =====================================================
+
+class MetricsBucket:
+    """Counters and a response-time digest for one (day, dimension, value)"""
+
+    __slots__ = ("counters", "digest")
+
+    def __init__(self, compression: float):
+        self.counters: Dict[str, float] = {}
+        self.digest = TDigest(compression)
+
+    def add(self, column: str, amount: float) -> None:
+        self.counters[column] = self.counters.get(column, 0) + amount
+
+    def merge(self, other: "MetricsBucket") -> None:
+        for column, amount in other.counters.items():
+            self.add(column, amount)
+        self.digest.merge(other.digest)
+
+    def is_empty(self) -> bool:
+        return self.digest.count == 0 and not any(self.counters.values())
+
+    def summary(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = dict(self.counters)
+        measured = self.counters.get("responses_measured", 0)
+        created = self.counters.get("leads_created", 0)
+        result["avg_response_time_minutes"] = (
+            round(self.counters.get("response_time_sum_minutes", 0) / measured, 2) if measured else None
+        )
+        result["conversion_rate"] = (
+            round(100.0 * self.counters.get("leads_converted", 0) / created, 2) if created else None
+        )
+        for label, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+            value = self.digest.quantile(q)
+            result[f"{label}_response_time_minutes"] = None if value is None else round(value, 2)
+        return result
+
+# =====================================================
+# AGGREGATOR
+# =====================================================
+
+class MetricsAggregator:
+    """
+    Consumes lead/interaction events and periodically upserts deltas
+
+    `connection` is a DB-API 2.0 connection with the %s paramstyle
+    (psycopg2, psycopg); pass None to aggregate in memory only.
+    """
+
+    def __init__(self, connection=None, retention_days: int = 35, compression: float = 100.0):
+        self.connection = connection
+        self.retention_days = retention_days
+        self.compression = compression
+        self._lock = threading.Lock()
+        self._totals: Dict[BucketKey, MetricsBucket] = {}
+        self._pending: Dict[BucketKey, MetricsBucket] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # -------------------------------------------------
+    # Event API
+    # -------------------------------------------------
+
+    def record_lead_created(self, lead: Dict[str, Any]) -> None:
+        """A new lead was stored (uses created_at, service_type, source, estimated_value, status)"""
+        created = _to_date(lead.get("created_at"))
+        value = float(lead.get("estimated_value") or 0)
+        service_type = lead.get("service_type")
+
+        updates = {"leads_created": 1, "estimated_pipeline_value": value}
+        for column in FUNNEL_COLUMNS.get(lead.get("status") or "new", ()):
+            updates[column] = 1
+        if lead.get("status") == "converted":
+            updates["converted_revenue"] = value
+
+        daily_updates = dict(updates)
+        if created.weekday() >= 5:
+            daily_updates["weekend_leads_count"] = 1
+        if service_type:
+            daily_updates[f"{service_type}_leads"] = 1
+
+        self._apply(created, lead, updates, daily_updates)
+
+    def record_lead_status_change(self, lead: Dict[str, Any], old_status: Optional[str], new_status: str) -> None:
+        """
+        A lead moved between statuses. Funnel counts stay keyed by the lead's
+        creation date, like the conversion_funnel view they replace.
+        """
+        before = set(FUNNEL_COLUMNS.get(old_status or "new", ()))
+        after = set(FUNNEL_COLUMNS.get(new_status, ()))
+        updates: Dict[str, float] = {column: 1 for column in after - before}
+        updates.update({column: -1 for column in before - after})
+
+        value = float(lead.get("estimated_value") or 0)
+        if "leads_converted" in after - before:
+            updates["converted_revenue"] = value
+        elif "leads_converted" in before - after:
+            updates["converted_revenue"] = -value
+
+        if updates:
+            self._apply(_to_date(lead.get("created_at")), lead, updates)
+
+    def record_interaction(self, interaction_type: str, occurred_at: Timestamp = None,
+                           lead: Optional[Dict[str, Any]] = None) -> None:
+        """An email was sent/opened/clicked; counted on the day it happened"""
+        column = EMAIL_COUNTERS.get(interaction_type)
+        if column is None:
+            return
+        self._apply(_to_date(occurred_at), lead or {}, {column: 1})
+
+    def record_response(self, lead: Dict[str, Any], responded_at: Timestamp = None) -> None:
+        """The lead's first automated response went out"""
+        created_at = _to_datetime(lead.get("created_at"))
+        responded = _to_datetime(responded_at)
+        minutes = max((responded - created_at).total_seconds() / 60, 0.0)
+        self._record_response_minutes(created_at.date(), lead, minutes)
+
+    def record_trace(self, trace, lead: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a finished LeadTrace; usable directly as a tracer exporter:
+        get_lead_tracer().add_exporter(aggregator.record_trace)
+
+        The service_type/source breakdown comes from the trace (see
+        LeadTracer.start_trace); `lead` overrides it when given.
+        """
+        lead = dict(trace.lead_dimensions(), **(lead or {}))
+
+        # The email_sent rows TraceBatchExporter writes for this trace
+        for interaction_type, end_unix_nano in trace.response_interactions():
+            column = EMAIL_COUNTERS.get(interaction_type)
+            if column is not None:
+                self._apply(_to_date(datetime.utcfromtimestamp(end_unix_nano / 1e9)), lead, {column: 1})
+
+        seconds = trace.response_seconds
+        if seconds is None:
+            # No email/SMS reached the lead: an SLA violation with no response time
+            self._apply(trace.submitted_at.date(), lead, {}, {"sla_violations": 1})
+            return
+        minutes = seconds / 60
+        extra = {"traced_responses": 1}
+        if minutes > SLA_MINUTES:
+            extra["sla_violations"] = 1
+        self._record_response_minutes(trace.submitted_at.date(), lead, minutes, extra)
+
+    # -------------------------------------------------
+    # Reading
+    # -------------------------------------------------
+
+    def daily_summary(self, metric_date: Optional[date] = None,
+                      dimension: str = DIMENSION_ALL, value: str = "") -> Optional[Dict[str, Any]]:
+        """Running in-process aggregate for one day (default: today, overall)"""
+        key = (metric_date or datetime.utcnow().date(), dimension, value)
+        with self._lock:
+            bucket = self._totals.get(key)
+            return bucket.summary() if bucket else None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """All running aggregates keyed by 'YYYY-MM-DD' then 'dimension:value'"""
+        result: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for (metric_date, dimension, value), bucket in sorted(self._totals.items()):
+                label = dimension if dimension == DIMENSION_ALL else f"{dimension}:{value}"
+                result.setdefault(metric_date.isoformat(), {})[label] = bucket.summary()
+        return result
+
+    # -------------------------------------------------
+    # Persistence
+    # -------------------------------------------------
+
+    def flush(self) -> int:
+        """Upsert pending deltas; returns the number of rows written"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        pending = {key: bucket for key, bucket in pending.items() if not bucket.is_empty()}
+        if not pending or self.connection is None:
+            return 0
+
+        cursor = self.connection.cursor()
+        try:
+            for key, bucket in sorted(pending.items()):
+                self._upsert(cursor, key, bucket)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            # Keep the deltas for the next attempt
+            with self._lock:
+                for key, bucket in pending.items():
+                    self._bucket(self._pending, key).merge(bucket)
+            raise
+        finally:
+            cursor.close()
+
+        return len(pending)
+
+    def start(self, interval_seconds: float = 60.0) -> None:
+        """Flush periodically from a daemon thread"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval_seconds,), name="tnt-metrics-aggregator", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flush thread and write any remaining deltas"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    # -------------------------------------------------
+    # Internal helpers
+    # -------------------------------------------------
+
+    def _run(self, interval_seconds: float) -> None:
+        while not self._stop_event.wait(interval_seconds):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Metrics aggregator flush failed: {str(e)}")
+            self._prune()
+
+    def _record_response_minutes(self, metric_date: date, lead: Dict[str, Any], minutes: float,
+                                 daily_extra: Optional[Dict[str, float]] = None) -> None:
+        updates = {
+            "responses_measured": 1,
+            "response_time_sum_minutes": minutes,
+            "responses_under_5min": 1 if minutes <= SLA_MINUTES else 0,
+        }
+        daily_updates = dict(updates, **(daily_extra or {}))
+        self._apply(metric_date, lead, updates, daily_updates, response_minutes=minutes)
+
+    def _apply(self, metric_date: date, lead: Dict[str, Any], updates: Dict[str, float],
+               daily_updates: Optional[Dict[str, float]] = None,
+               response_minutes: Optional[float] = None) -> None:
+        keys: List[Tuple[BucketKey, Dict[str, float]]] = [
+            ((metric_date, DIMENSION_ALL, ""), daily_updates or updates),
+        ]
+        for dimension in (DIMENSION_SERVICE_TYPE, DIMENSION_SOURCE):
+            if lead.get(dimension):
+                keys.append(((metric_date, dimension, str(lead[dimension])), updates))
+
+        with self._lock:
+            for key, columns in keys:
+                for store in (self._totals, self._pending):
+                    bucket = self._bucket(store, key)
+                    for column, amount in columns.items():
+                        bucket.add(column, amount)
+                    if response_minutes is not None:
+                        bucket.digest.add(response_minutes)
+
+    def _bucket(self, store: Dict[BucketKey, MetricsBucket], key: BucketKey) -> MetricsBucket:
+        bucket = store.get(key)
+        if bucket is None:
+            bucket = store[key] = MetricsBucket(self.compression)
+        return bucket
+
+    def _prune(self) -> None:
+        cutoff = datetime.utcnow().date() - timedelta(days=self.retention_days)
+        with self._lock:
+            for key in [key for key in self._totals if key[0] < cutoff]:
+                del self._totals[key]
+
+    def _upsert(self, cursor, key: BucketKey, bucket: MetricsBucket) -> None:
+        metric_date, dimension, value = key
+        if dimension == DIMENSION_ALL:
+            table = "daily_metrics"
+            key_columns, key_values = ["metric_date"], [metric_date]
+            columns = COUNTER_COLUMNS + DAILY_ONLY_COLUMNS
+        else:
+            table = "daily_metrics_breakdown"
+            key_columns, key_values = ["metric_date", "dimension", "dimension_value"], [metric_date, dimension, value]
+            columns = COUNTER_COLUMNS
+
+        deltas = [bucket.counters.get(column, 0) for column in columns]
+        cursor.execute(_upsert_sql(table, key_columns, columns), key_values + deltas)
+
+        # Merge the response-time digest under a row lock
+        where = " AND ".join(f"{column} = %s" for column in key_columns)
+        cursor.execute(f"SELECT response_time_digest FROM {table} WHERE {where} FOR UPDATE", key_values)
+        row = cursor.fetchone()
+        stored = row[0] if row else None
+        if isinstance(stored, str):
+            stored = json.loads(stored)
+
+        digest = TDigest.from_dict(stored)
+        digest.merge(bucket.digest)
+        quantiles = [digest.quantile(q) for q in (0.50, 0.95, 0.99)]
+
+        derived = DAILY_DERIVED_SQL if table == "daily_metrics" else ""
+        cursor.execute(
+            f"UPDATE {table} SET response_time_digest = %s, "
+            f"p50_response_time_minutes = %s, p95_response_time_minutes = %s, "
+            f"p99_response_time_minutes = %s{derived} WHERE {where}",
+            [json.dumps(digest.to_dict())] + [_round(value) for value in quantiles] + key_values,
+        )
+
+def _upsert_sql(table: str, key_columns: List[str], columns: Tuple[str, ...]) -> str:
+    """INSERT ... ON CONFLICT that adds the deltas to the stored counters"""
+    insert_columns = ", ".join(key_columns + list(columns))
+    placeholders = ", ".join(["%s"] * (len(key_columns) + len(columns)))
+    increments = ",\n    ".join(
+        f"{column} = COALESCE({table}.{column}, 0) + EXCLUDED.{column}" for column in columns
+    )
+    return (
+        f"INSERT INTO {table} ({insert_columns}, calculated_at)\n"
+        f"VALUES ({placeholders}, CURRENT_TIMESTAMP)\n"
+        f"ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET\n"
+        f"    {increments},\n"
+        f"    calculated_at = CURRENT_TIMESTAMP"
+    )
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 2)
+
+def _to_datetime(value: Timestamp) -> datetime:
+    """Naive UTC datetime, matching the schema's TIMESTAMP columns"""
+    if value is None:
+        return datetime.utcnow()
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _to_date(value: Timestamp) -> date:
+    return _to_datetime(value).date()
@@ -0,0 +1,54 @@
+"""
+Base configuration types shared by every TNT integration
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from .vault import get_credential_vault
+
+# =====================================================
+# CONFIGURATION CLASSES
+# =====================================================
+
+class IntegrationType(Enum):
+    """Types of external integrations supported"""
+    CRM = "crm"
+    DISPATCH = "dispatch"
+    EMAIL = "email"
+    NOTIFICATION = "notification"
+    SMS = "sms"
+
+class SyncFrequency(Enum):
+    """Data synchronization frequency options"""
+    REAL_TIME = "real_time"
+    EVERY_5_MINUTES = "5_minutes"
+    EVERY_15_MINUTES = "15_minutes"
+    HOURLY = "hourly"
+    DAILY = "daily"
+
+@dataclass
+class IntegrationConfig:
+    """Base configuration for all integrations"""
+    service_name: str
+    integration_type: IntegrationType
+    enabled: bool = True
+    sync_frequency: SyncFrequency = SyncFrequency.REAL_TIME
+    retry_attempts: int = 3
+    timeout_seconds: int = 30
+    rate_limit_per_minute: int = 60
+
+    def __post_init__(self):
+        self.created_at = datetime.utcnow()
+        # Shared process-wide vault; raises ValueError if no key is configured
+        self.vault = get_credential_vault()
+
+    async def check_connectivity(self) -> str:
+        """
+        Probe the external service and return a health status string.
+
+        Subclasses that talk to a remote system override this; the default is
+        a basic enabled/disabled check for services without a cheap probe.
+        """
+        return "healthy" if self.enabled else "disabled"
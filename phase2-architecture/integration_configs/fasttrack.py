@@ -0,0 +1,140 @@
+"""
+FastTrack InVision dispatch integration configuration
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+from .base import IntegrationConfig, IntegrationType, SyncFrequency
+from .metrics import instrumented
+
+# =====================================================
+# FASTTRACK INVISION INTEGRATION
+# =====================================================
+
+@dataclass
+class FastTrackConfig(IntegrationConfig):
+    """
+    FastTrack InVision dispatch software integration
+
+    Business Requirements:
+    - Customer profile synchronization
+    - Booking status updates
+    - Vehicle availability checking
+    - Trip assignment automation
+    """
+
+    service_name: str = "fasttrack_invision"
+    integration_type: IntegrationType = IntegrationType.DISPATCH
+
+    # API Configuration
+    api_endpoint: str = field(default_factory=lambda: os.getenv('FASTTRACK_API_ENDPOINT', ''))
+    api_key: str = field(default_factory=lambda: os.getenv('FASTTRACK_API_KEY', ''))
+    company_id: str = field(default_factory=lambda: os.getenv('FASTTRACK_COMPANY_ID', ''))
+
+    # Feature Configuration
+    auto_create_customers: bool = True
+    auto_assign_trips: bool = False  # Requires manual approval
+    check_vehicle_availability: bool = True
+    sync_booking_status: bool = True
+
+    # Data Mapping
+    customer_mapping: Dict[str, str] = field(default_factory=lambda: {
+        "company_name": "company_name",
+        "contact_name": "contact_name",
+        "email": "email_address",
+        "phone": "phone_number",
+        "billing_address": "address_line_1"
+    })
+
+    # Trip Configuration
+    default_vehicle_type: str = "sedan"
+    default_service_level: str = "corporate"
+    booking_lead_time_hours: int = 2
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.service_name = "fasttrack_invision"
+        self.integration_type = IntegrationType.DISPATCH
+        self.sync_frequency = SyncFrequency.EVERY_15_MINUTES
+
+    async def check_connectivity(self) -> str:
+        """Test FastTrack API connectivity"""
+        import aiohttp
+
+        async with aiohttp.ClientSession() as session:
+            headers = self.get_headers()
+            async with session.get(f"{self.api_endpoint}/health", headers=headers) as response:
+                return "healthy" if response.status == 200 else "warning"
+
+    def get_headers(self) -> Dict[str, str]:
+        """Generate request headers for FastTrack API"""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "X-Company-ID": self.company_id,
+            "User-Agent": "TNT-Lead-System/2.0"
+        }
+
+    @instrumented("format")
+    def format_customer_for_fasttrack(self, tnt_lead: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert TNT lead to FastTrack customer format"""
+        customer_data = {}
+
+        for tnt_field, ft_field in self.customer_mapping.items():
+            if tnt_field in tnt_lead and tnt_lead[tnt_field]:
+                customer_data[ft_field] = tnt_lead[tnt_field]
+
+        # Add FastTrack-specific fields
+        customer_data.update({
+            "customer_type": "corporate" if tnt_lead.get("company_name") else "individual",
+            "source": "TNT Lead System",
+            "tnt_lead_id": tnt_lead.get("lead_id"),
+            "preferred_payment": "invoice",
+            "vip_status": tnt_lead.get("lead_score", 0) >= 80
+        })
+
+        return customer_data
+
+    @instrumented("format")
+    def create_trip_quote(self, tnt_lead: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate trip quote for FastTrack system"""
+        return {
+            "pickup_address": tnt_lead.get("pickup_location"),
+            "destination_address": tnt_lead.get("destination"),
+            "service_date": tnt_lead.get("service_date"),
+            "passenger_count": tnt_lead.get("passenger_count", 1),
+            "vehicle_type": self._determine_vehicle_type(tnt_lead),
+            "service_level": self.default_service_level,
+            "estimated_duration": self._estimate_duration(tnt_lead),
+            "special_instructions": tnt_lead.get("custom_fields", {}).get("special_instructions", ""),
+            "billing_reference": tnt_lead.get("custom_fields", {}).get("billing_account", "")
+        }
+
+    def _determine_vehicle_type(self, tnt_lead: Dict[str, Any]) -> str:
+        """Determine appropriate vehicle type based on passenger count and service type"""
+        passenger_count = tnt_lead.get("passenger_count", 1)
+        service_type = tnt_lead.get("service_type", "")
+
+        if passenger_count >= 8:
+            return "van"
+        elif passenger_count >= 4 or service_type == "wedding":
+            return "suv"
+        elif service_type == "corporate":
+            return "luxury_sedan"
+        else:
+            return "sedan"
+
+    def _estimate_duration(self, tnt_lead: Dict[str, Any]) -> int:
+        """Estimate trip duration in minutes"""
+        service_type = tnt_lead.get("service_type", "")
+
+        if service_type == "airport":
+            return 90  # Average airport transfer time
+        elif service_type == "hourly":
+            return 120  # Default hourly booking
+        elif service_type == "wedding":
+            return 180  # Wedding service duration
+        else:
+            return 60   # Default corporate transfer
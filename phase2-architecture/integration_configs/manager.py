@@ -0,0 +1,190 @@
+"""
+Integration manager - central registry and health monitoring for all integrations
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import IntegrationConfig
+from .metrics import IntegrationMetrics, get_integration_metrics
+from .shared_state import LocalStateBackend, SharedStateBackend
+
+# =====================================================
+# INTEGRATION REGISTRY
+# =====================================================
+
+# Service name -> (enabling environment variable, submodule, config class)
+# Submodules are imported only when the integration is first used.
+INTEGRATION_REGISTRY: Dict[str, Tuple[str, str, str]] = {
+    'zoho_crm': ('ZOHO_CLIENT_ID', 'zoho_crm', 'ZohoCRMConfig'),
+    'fasttrack': ('FASTTRACK_API_ENDPOINT', 'fasttrack', 'FastTrackConfig'),
+    'richweb_smtp': ('RICHWEB_SMTP_USERNAME', 'richweb_smtp', 'RichWebSMTPConfig'),
+    'slack': ('SLACK_WEBHOOK_URL', 'slack', 'SlackConfig'),
+    'sms': ('TWILIO_ACCOUNT_SID', 'sms', 'SMSConfig'),
+}
+
+# =====================================================
+# INTEGRATION MANAGER
+# =====================================================
+
+class IntegrationManager:
+    """
+    Central manager for all external integrations
+    Handles configuration, health monitoring, and coordination
+
+    Integrations are constructed on first use rather than at construction
+    time, so short-lived processes only build the configs they touch.
+
+    Rate limits and health results go through `state_backend`, so managers
+    in several worker processes share them; the default backend is local
+    to this process.
+    """
+
+    def __init__(self, state_backend: Optional[SharedStateBackend] = None):
+        self._integrations: Dict[str, IntegrationConfig] = {}
+        self.logger = logging.getLogger(__name__)
+        self.health_status: Dict[str, Dict[str, Any]] = {}
+        self.metrics: IntegrationMetrics = get_integration_metrics()
+        self.state_backend: SharedStateBackend = state_backend or LocalStateBackend()
+
+    @property
+    def integrations(self) -> Dict[str, IntegrationConfig]:
+        """All configured integrations, constructing any not yet built"""
+        for service_name in self.configured_services():
+            self.get_integration(service_name)
+        return self._integrations
+
+    def configured_services(self) -> List[str]:
+        """Service names whose enabling environment variable is set"""
+        return [
+            service_name
+            for service_name, (env_var, _, _) in INTEGRATION_REGISTRY.items()
+            if os.getenv(env_var)
+        ]
+
+    def _create_integration(self, service_name: str) -> IntegrationConfig:
+        """Import and construct a single integration configuration"""
+        _, module_name, class_name = INTEGRATION_REGISTRY[service_name]
+        try:
+            module = importlib.import_module(f".{module_name}", __package__)
+            config = getattr(module, class_name)()
+        except Exception as e:
+            self.logger.error(f"Error initializing {service_name} integration: {str(e)}")
+            raise
+
+        self.logger.info(f"Initialized {service_name} integration")
+        return config
+
+    def get_integration(self, service_name: str) -> Optional[IntegrationConfig]:
+        """Get integration configuration by service name"""
+        config = self._integrations.get(service_name)
+        if config is not None:
+            return config
+
+        registration = INTEGRATION_REGISTRY.get(service_name)
+        if registration is None or not os.getenv(registration[0]):
+            return None
+
+        config = self._create_integration(service_name)
+        self._integrations[service_name] = config
+        return config
+
+    def is_integration_enabled(self, service_name: str) -> bool:
+        """Check if integration is enabled and configured"""
+        integration = self.get_integration(service_name)
+        return integration is not None and integration.enabled
+
+    async def health_check_all(self) -> Dict[str, Dict[str, Any]]:
+        """Perform health check on all integrations"""
+        health_results = {}
+
+        for service_name, config in self.integrations.items():
+            try:
+                health_results[service_name] = await self._health_check_integration(service_name, config)
+            except Exception as e:
+                health_results[service_name] = {
+                    "status": "error",
+                    "error": str(e),
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+
+        self.health_status = health_results
+        for service_name, status in health_results.items():
+            try:
+                await self.state_backend.publish_health(service_name, status)
+            except Exception as e:
+                self.logger.warning(f"Could not publish {service_name} health status: {str(e)}")
+        return health_results
+
+    async def shared_health_status(self) -> Dict[str, Dict[str, Any]]:
+        """Latest health status published by any manager sharing the state backend"""
+        return await self.state_backend.get_health()
+
+    async def _health_check_integration(self, service_name: str, config: IntegrationConfig) -> Dict[str, Any]:
+        """Perform health check on specific integration"""
+        start_time = time.perf_counter()
+
+        try:
+            async with self.metrics.track(config.service_name, "health_check"):
+                status = await config.check_connectivity()
+
+            response_time = time.perf_counter() - start_time
+
+            return {
+                "status": status,
+                "response_time_ms": int(response_time * 1000),
+                "last_checked": datetime.utcnow().isoformat(),
+                "enabled": config.enabled
+            }
+
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": str(e),
+                "last_checked": datetime.utcnow().isoformat(),
+                "enabled": config.enabled
+            }
+
+    async def throttle(self, service_name: str, burst: int = 1) -> float:
+        """
+        Wait for a slot under the integration's rate_limit_per_minute.
+        The limit is shared by every manager using the same state backend.
+        Returns the seconds spent waiting.
+        """
+        config = self.get_integration(service_name)
+        if config is None:
+            return 0.0
+
+        wait = await self.state_backend.reserve(config.service_name, config.rate_limit_per_minute, burst)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self.metrics.observe_rate_limit_wait(config.service_name, wait)
+        return wait
+
+    def track_sync(self, service_name: str):
+        """Context manager (sync or async) timing one sync job for an integration"""
+        # Build the config if needed so the label is always config.service_name
+        config = self.get_integration(service_name)
+        label = config.service_name if config is not None else service_name
+        return self.metrics.track(label, "sync")
+
+    def get_sync_schedule(self) -> Dict[str, List[str]]:
+        """Get synchronization schedule for all integrations"""
+        schedule = {
+            "real_time": [],
+            "5_minutes": [],
+            "15_minutes": [],
+            "hourly": [],
+            "daily": []
+        }
+
+        for service_name, config in self.integrations.items():
+            if config.enabled:
+                schedule[config.sync_frequency.value].append(service_name)
+
+        return schedule
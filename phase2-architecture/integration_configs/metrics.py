@@ -0,0 +1,379 @@
+"""
+Integration instrumentation - per-service latency, throughput and error metrics
+
+Records monotonic-clock latency histograms, in-flight gauges, error counters,
+queue depths and rate-limiter waits for every integration call path, and
+exposes them both as a Python API (snapshot/quantile) and in the Prometheus
+text exposition format.
+
+Usage:
+    metrics = get_integration_metrics()
+
+    with metrics.track("zoho_crm", "send"):
+        ...
+
+    @instrumented("format")
+    def format_lead_for_zoho(self, tnt_lead): ...
+
+    start_metrics_server(port=9464)  # serves /metrics and /metrics.json
+"""
+
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .tdigest import TDigest
+
+# Latency buckets in seconds, spanning fast formatting calls up to the 5-minute
+# SLA, with extra resolution in the 1-5 minute range around it
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 90.0, 120.0, 150.0, 180.0,
+    210.0, 240.0, 270.0, 300.0, 450.0, 600.0,
+)
+
+METRIC_PREFIX = "tnt_integration"
+
+# =====================================================
+# HISTOGRAM
+# =====================================================
+
+class Histogram:
+    """
+    Fixed-bucket histogram (cumulative on export, like Prometheus)
+
+    Quantiles come from a t-digest of the same observations rather than
+    from the buckets, so they stay accurate between widely spaced bounds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.digest = TDigest()
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.digest.add(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile, clamped to the observed min/max"""
+        if self.count == 0:
+            return None
+        return min(max(self.digest.quantile(q), self.min), self.max)
+
+    def cumulative_counts(self) -> List[Tuple[str, int]]:
+        total = 0
+        result = []
+        for bound, bucket_count in zip(list(self.buckets) + [float("inf")], self.counts):
+            total += bucket_count
+            result.append(("+Inf" if bound == float("inf") else _format_value(bound), total))
+        return result
+
+# =====================================================
+# METRICS REGISTRY
+# =====================================================
+
+class IntegrationMetrics:
+    """Thread-safe registry of per-integration metrics"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        self._in_flight: Dict[Tuple[str, str], int] = {}
+        self._errors: Dict[Tuple[str, str, str], int] = {}
+        self._queue_depth: Dict[Tuple[str, str], float] = {}
+        self._rate_limit_wait: Dict[str, Histogram] = {}
+
+    # -------------------------------------------------
+    # Recording API
+    # -------------------------------------------------
+
+    def track(self, service: str, operation: str) -> "CallTracker":
+        """Context manager (sync or async) timing one call with the monotonic clock"""
+        return CallTracker(self, service, operation)
+
+    def call_started(self, service: str, operation: str) -> None:
+        key = (service, operation)
+        with self._lock:
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def call_finished(self, service: str, operation: str, seconds: float,
+                      error: Optional[BaseException] = None) -> None:
+        key = (service, operation)
+        with self._lock:
+            self._in_flight[key] = max(self._in_flight.get(key, 0) - 1, 0)
+            self._observe(self._latency, key, seconds)
+            if error is not None:
+                error_key = (service, operation, type(error).__name__)
+                self._errors[error_key] = self._errors.get(error_key, 0) + 1
+
+    def observe_latency(self, service: str, operation: str, seconds: float) -> None:
+        """Record a latency measured elsewhere (e.g. reported by a worker)"""
+        with self._lock:
+            self._observe(self._latency, (service, operation), seconds)
+
+    def record_error(self, service: str, operation: str, error_type: str) -> None:
+        key = (service, operation, error_type)
+        with self._lock:
+            self._errors[key] = self._errors.get(key, 0) + 1
+
+    def set_queue_depth(self, service: str, depth: float, queue: str = "default") -> None:
+        with self._lock:
+            self._queue_depth[(service, queue)] = depth
+
+    def observe_rate_limit_wait(self, service: str, seconds: float) -> None:
+        """Record time a call spent blocked on the service's rate limiter"""
+        with self._lock:
+            self._observe(self._rate_limit_wait, service, seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latency.clear()
+            self._in_flight.clear()
+            self._errors.clear()
+            self._queue_depth.clear()
+            self._rate_limit_wait.clear()
+
+    # -------------------------------------------------
+    # Python API
+    # -------------------------------------------------
+
+    def quantile(self, service: str, operation: str, q: float) -> Optional[float]:
+        """Estimated latency quantile in seconds, or None with no observations"""
+        with self._lock:
+            histogram = self._latency.get((service, operation))
+            return histogram.quantile(q) if histogram else None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-service view of all metrics, latencies in milliseconds"""
+        services: Dict[str, Dict[str, Any]] = {}
+
+        def service_entry(service: str) -> Dict[str, Any]:
+            return services.setdefault(service, {
+                "operations": {},
+                "queue_depth": {},
+                "rate_limit_wait": None,
+            })
+
+        def operation_entry(service: str, operation: str) -> Dict[str, Any]:
+            return service_entry(service)["operations"].setdefault(operation, {
+                "count": 0, "errors": {}, "in_flight": 0,
+                "avg_ms": None, "p50_ms": None, "p95_ms": None, "p99_ms": None,
+            })
+
+        with self._lock:
+            for (service, operation), histogram in self._latency.items():
+                entry = operation_entry(service, operation)
+                entry.update(_histogram_summary(histogram))
+
+            for (service, operation), in_flight in self._in_flight.items():
+                operation_entry(service, operation)["in_flight"] = in_flight
+
+            for (service, operation, error_type), count in self._errors.items():
+                operation_entry(service, operation)["errors"][error_type] = count
+
+            for (service, queue), depth in self._queue_depth.items():
+                service_entry(service)["queue_depth"][queue] = depth
+
+            for service, histogram in self._rate_limit_wait.items():
+                service_entry(service)["rate_limit_wait"] = _histogram_summary(histogram)
+
+        return services
+
+    # -------------------------------------------------
+    # Prometheus exposition
+    # -------------------------------------------------
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (0.0.4)"""
+        lines: List[str] = []
+
+        with self._lock:
+            name = f"{METRIC_PREFIX}_call_duration_seconds"
+            lines.append(f"# HELP {name} Integration call latency by service and operation.")
+            lines.append(f"# TYPE {name} histogram")
+            for (service, operation), histogram in sorted(self._latency.items()):
+                _render_histogram(lines, name, {"service": service, "operation": operation}, histogram)
+
+            name = f"{METRIC_PREFIX}_calls_in_flight"
+            lines.append(f"# HELP {name} Integration calls currently executing.")
+            lines.append(f"# TYPE {name} gauge")
+            for (service, operation), value in sorted(self._in_flight.items()):
+                lines.append(_sample(name, {"service": service, "operation": operation}, value))
+
+            name = f"{METRIC_PREFIX}_errors_total"
+            lines.append(f"# HELP {name} Integration calls that raised, by exception type.")
+            lines.append(f"# TYPE {name} counter")
+            for (service, operation, error_type), value in sorted(self._errors.items()):
+                labels = {"service": service, "operation": operation, "error": error_type}
+                lines.append(_sample(name, labels, value))
+
+            name = f"{METRIC_PREFIX}_queue_depth"
+            lines.append(f"# HELP {name} Pending work items per integration queue.")
+            lines.append(f"# TYPE {name} gauge")
+            for (service, queue), value in sorted(self._queue_depth.items()):
+                lines.append(_sample(name, {"service": service, "queue": queue}, value))
+
+            name = f"{METRIC_PREFIX}_rate_limit_wait_seconds"
+            lines.append(f"# HELP {name} Time spent waiting on integration rate limiters.")
+            lines.append(f"# TYPE {name} histogram")
+            for service, histogram in sorted(self._rate_limit_wait.items()):
+                _render_histogram(lines, name, {"service": service}, histogram)
+
+        return "\n".join(lines) + "\n"
+
+    # -------------------------------------------------
+    # Internal helpers
+    # -------------------------------------------------
+
+    def _observe(self, histograms: Dict[Any, Histogram], key: Any, seconds: float) -> None:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+class CallTracker:
+    """Times a single integration call; usable with `with` and `async with`"""
+
+    __slots__ = ("metrics", "service", "operation", "start")
+
+    def __init__(self, metrics: IntegrationMetrics, service: str, operation: str):
+        self.metrics = metrics
+        self.service = service
+        self.operation = operation
+        self.start = 0.0
+
+    def __enter__(self) -> "CallTracker":
+        self.metrics.call_started(self.service, self.operation)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        elapsed = time.perf_counter() - self.start
+        self.metrics.call_finished(self.service, self.operation, elapsed, exc)
+        return False
+
+    async def __aenter__(self) -> "CallTracker":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, traceback) -> bool:
+        return self.__exit__(exc_type, exc, traceback)
+
+# =====================================================
+# PROCESS-WIDE REGISTRY AND DECORATOR
+# =====================================================
+
+_default_metrics = IntegrationMetrics()
+
+def get_integration_metrics() -> IntegrationMetrics:
+    """Return the process-wide metrics registry"""
+    return _default_metrics
+
+def instrumented(operation: str) -> Callable[[Callable], Callable]:
+    """
+    Decorate an IntegrationConfig method so every call is tracked under
+    (self.service_name, operation). Works for both sync and async methods.
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                async with _default_metrics.track(self.service_name, operation):
+                    return await func(self, *args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with _default_metrics.track(self.service_name, operation):
+                return func(self, *args, **kwargs)
+        return wrapper
+
+    return decorator
+
+# =====================================================
+# PROMETHEUS ENDPOINT
+# =====================================================
+
+def start_metrics_server(port: int = 9464, host: str = "0.0.0.0",
+                         metrics: Optional[IntegrationMetrics] = None):
+    """
+    Serve /metrics (Prometheus text) and /metrics.json (snapshot) from a
+    daemon thread. Returns the server; call shutdown() to stop it.
+    """
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    registry = metrics or _default_metrics
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path == "/metrics":
+                body = registry.render_prometheus().encode()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/metrics.json":
+                body = json.dumps(registry.snapshot()).encode()
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Scrapes every few seconds would flood stderr
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="tnt-metrics-server", daemon=True)
+    thread.start()
+    return server
+
+# =====================================================
+# FORMATTING HELPERS
+# =====================================================
+
+def _histogram_summary(histogram: Histogram) -> Dict[str, Any]:
+    def to_ms(seconds: Optional[float]) -> Optional[float]:
+        return None if seconds is None else round(seconds * 1000, 3)
+
+    return {
+        "count": histogram.count,
+        "avg_ms": to_ms(histogram.sum / histogram.count) if histogram.count else None,
+        "p50_ms": to_ms(histogram.quantile(0.50)),
+        "p95_ms": to_ms(histogram.quantile(0.95)),
+        "p99_ms": to_ms(histogram.quantile(0.99)),
+    }
+
+def _render_histogram(lines: List[str], name: str, labels: Dict[str, str], histogram: Histogram) -> None:
+    for bound, count in histogram.cumulative_counts():
+        lines.append(_sample(f"{name}_bucket", dict(labels, le=bound), count))
+    lines.append(_sample(f"{name}_sum", labels, histogram.sum))
+    lines.append(_sample(f"{name}_count", labels, histogram.count))
+
+def _sample(name: str, labels: Dict[str, Any], value: float) -> str:
+    label_text = ",".join(f'{key}="{_escape_label(str(val))}"' for key, val in labels.items())
+    return f"{name}{{{label_text}}} {_format_value(value)}"
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
@@ -0,0 +1,160 @@
+"""
+richweb.net SMTP email automation configuration
+"""
+
+import asyncio
+import os
+import smtplib
+from dataclasses import dataclass, field
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from .base import IntegrationConfig, IntegrationType
+from .metrics import instrumented
+
+# =====================================================
+# RICHWEB.NET SMTP INTEGRATION
+# =====================================================
+
+@dataclass
+class RichWebSMTPConfig(IntegrationConfig):
+    """
+    richweb.net SMTP email automation configuration
+
+    Business Requirements:
+    - 5-minute automated response guarantee
+    - Branded email templates with TNT styling
+    - Email engagement tracking (opens, clicks)
+    - Bounce handling and unsubscribe management
+    """
+
+    service_name: str = "richweb_smtp"
+    integration_type: IntegrationType = IntegrationType.EMAIL
+
+    # SMTP Configuration
+    smtp_host: str = "mail.richweb.net"
+    smtp_port: int = 587
+    use_tls: bool = True
+    username: str = field(default_factory=lambda: os.getenv('RICHWEB_SMTP_USERNAME', ''))
+    password: str = field(default_factory=lambda: os.getenv('RICHWEB_SMTP_PASSWORD', ''))
+
+    # Email Configuration
+    from_address: str = "TNT Limousine <noreply@tntlimousine.com>"
+    reply_to: str = "info@tntlimousine.com"
+    return_path: str = "bounce@tntlimousine.com"
+
+    # Tracking Configuration
+    track_opens: bool = True
+    track_clicks: bool = True
+    track_unsubscribes: bool = True
+    bounce_webhook_url: str = field(default_factory=lambda: os.getenv('TNT_WEBHOOK_URL', '') + '/webhooks/email-engagement')
+
+    # Rate Limiting
+    daily_send_limit: int = 5000
+    hourly_send_limit: int = 500
+    max_recipients_per_email: int = 1
+
+    # Template Configuration
+    base_template_path: str = "email_templates/"
+    include_unsubscribe_link: bool = True
+    add_tracking_pixel: bool = True
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.service_name = "richweb_smtp"
+        self.integration_type = IntegrationType.EMAIL
+
+    async def check_connectivity(self) -> str:
+        """Test SMTP connectivity (smtplib blocks, so the probe runs in a thread)"""
+        try:
+            server = await asyncio.to_thread(self.get_smtp_connection)
+            await asyncio.to_thread(server.quit)
+            return "healthy"
+        except Exception:
+            return "error"
+
+    @instrumented("connect")
+    def get_smtp_connection(self):
+        """Create SMTP connection to richweb.net"""
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout_seconds)
+        if self.use_tls:
+            server.starttls()
+        server.login(self.username, self.password)
+        return server
+
+    @instrumented("send")
+    def send_email(self, message: MIMEMultipart, server=None) -> None:
+        """Send a message, reusing server if given or opening a one-off connection"""
+        if server is not None:
+            server.send_message(message)
+            return
+
+        server = self.get_smtp_connection()
+        try:
+            server.send_message(message)
+        finally:
+            server.quit()
+
+    @instrumented("format")
+    def create_email_message(self,
+                           to_address: str,
+                           subject: str,
+                           text_content: str,
+                           html_content: str = None,
+                           tracking_id: str = None) -> MIMEMultipart:
+        """Create email message with TNT branding and tracking"""
+
+        msg = MIMEMultipart('alternative')
+        msg['From'] = self.from_address
+        msg['To'] = to_address
+        msg['Subject'] = subject
+        msg['Reply-To'] = self.reply_to
+        msg['Return-Path'] = self.return_path
+
+        # Add tracking headers
+        if tracking_id:
+            msg['X-TNT-Tracking-ID'] = tracking_id
+            msg['X-TNT-Campaign'] = "automated_response"
+
+        # Add text content
+        text_part = MIMEText(text_content, 'plain')
+        msg.attach(text_part)
+
+        # Add HTML content with tracking
+        if html_content:
+            if self.add_tracking_pixel and tracking_id:
+                html_content = self._add_tracking_pixel(html_content, tracking_id)
+
+            if self.include_unsubscribe_link:
+                html_content = self._add_unsubscribe_link(html_content, to_address)
+
+            html_part = MIMEText(html_content, 'html')
+            msg.attach(html_part)
+
+        return msg
+
+    def _add_tracking_pixel(self, html_content: str, tracking_id: str) -> str:
+        """Add invisible tracking pixel for open tracking"""
+        tracking_url = f"{os.getenv('TNT_API_URL')}/track/open/{tracking_id}"
+        pixel = f'<img src="{tracking_url}" width="1" height="1" style="display:none;" />'
+
+        # Insert before closing body tag
+        if '</body>' in html_content:
+            return html_content.replace('</body>', f'{pixel}</body>')
+        else:
+            return html_content + pixel
+
+    def _add_unsubscribe_link(self, html_content: str, email: str) -> str:
+        """Add unsubscribe link to email content"""
+        unsubscribe_url = f"{os.getenv('TNT_API_URL')}/unsubscribe?email={email}"
+        unsubscribe_html = f'''
+        <div style="text-align: center; font-size: 12px; color: #666; margin-top: 20px;">
+            <p>TNT Limousine | Richmond, VA | (804) 346-4141</p>
+            <p><a href="{unsubscribe_url}" style="color: #666;">Unsubscribe from automated emails</a></p>
+        </div>
+        '''
+
+        if '</body>' in html_content:
+            return html_content.replace('</body>', f'{unsubscribe_html}</body>')
+        else:
+            return html_content + unsubscribe_html
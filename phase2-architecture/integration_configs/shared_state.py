@@ -0,0 +1,180 @@
+"""
+Shared integration state - rate limits and health across worker processes
+
+Every worker process talks to the same external APIs, so per-service rate
+limits and the latest health check result have to live outside any single
+IntegrationManager. Two interchangeable backends:
+- LocalStateBackend: in-process dict, or a multiprocessing.Manager dict when
+  shared between the workers of one host
+- RedisStateBackend: Redis (REDIS_URL), shared across hosts
+
+Rate limits use GCRA (generic cell rate algorithm): one timestamp per
+service, updated atomically, and callers are told how long to wait rather
+than being rejected.
+
+Usage:
+    backend = create_state_backend()            # Redis if REDIS_URL is set
+    wait = await backend.reserve("zoho_crm", rate_per_minute=100)
+    await asyncio.sleep(wait)
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+
+# =====================================================
+# BACKEND INTERFACE
+# =====================================================
+
+class SharedStateBackend(ABC):
+    """Rate-limit reservations and health status shared by all workers"""
+
+    @abstractmethod
+    async def reserve(self, service: str, rate_per_minute: float, burst: int = 1) -> float:
+        """Reserve one call slot; returns seconds the caller must wait before calling"""
+
+    @abstractmethod
+    async def publish_health(self, service: str, status: Dict[str, Any]) -> None:
+        """Store the latest health check result for a service"""
+
+    @abstractmethod
+    async def get_health(self) -> Dict[str, Dict[str, Any]]:
+        """Latest published health status per service"""
+
+    async def close(self) -> None:
+        pass
+
+def _gcra(tat: Optional[float], now: float, rate_per_minute: float, burst: int) -> Tuple[float, float]:
+    """Return (wait seconds, new theoretical arrival time) for one reservation"""
+    interval = 60.0 / rate_per_minute
+    tolerance = interval * (max(burst, 1) - 1)
+    tat = max(tat or now, now)
+    wait = max(0.0, tat - tolerance - now)
+    return wait, tat + interval
+
+# =====================================================
+# LOCAL STAND-IN
+# =====================================================
+
+class LocalStateBackend(SharedStateBackend):
+    """
+    Dict-backed state for a single host
+
+    With no arguments the state is private to this process. To share it
+    between worker processes pass proxies from a multiprocessing.Manager:
+
+        manager = multiprocessing.Manager()
+        backend = LocalStateBackend(manager.dict(), manager.Lock())
+
+    The backend pickles with its proxies, so it can be handed to workers.
+    """
+
+    def __init__(self, state: Optional[MutableMapping[str, Any]] = None, lock: Any = None):
+        self.state = state if state is not None else {}
+        self.lock = lock if lock is not None else threading.Lock()
+
+    # Manager proxies block on IPC (and the lock on other workers), so every
+    # access runs in a thread instead of stalling the worker's event loop
+
+    async def reserve(self, service: str, rate_per_minute: float, burst: int = 1) -> float:
+        if rate_per_minute <= 0:
+            return 0.0
+        return await asyncio.to_thread(self._reserve, service, rate_per_minute, burst)
+
+    async def publish_health(self, service: str, status: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self.state.__setitem__, f"health:{service}", dict(status))
+
+    async def get_health(self) -> Dict[str, Dict[str, Any]]:
+        items = await asyncio.to_thread(lambda: list(self.state.items()))
+        return {
+            key[len("health:"):]: value
+            for key, value in items
+            if key.startswith("health:")
+        }
+
+    def _reserve(self, service: str, rate_per_minute: float, burst: int) -> float:
+        key = f"ratelimit:{service}"
+        with self.lock:
+            wait, self.state[key] = _gcra(self.state.get(key), time.time(), rate_per_minute, burst)
+        return wait
+
+# =====================================================
+# REDIS
+# =====================================================
+
+# Atomic GCRA reservation: KEYS[1] = TAT key, ARGV = interval, tolerance.
+# Uses the Redis clock so workers on hosts with clock skew agree.
+_RESERVE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local wait = tat - tolerance - now
+if wait < 0 then wait = 0 end
+local new_tat = tat + interval
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000) + 1000)
+return tostring(wait)
+"""
+
+class RedisStateBackend(SharedStateBackend):
+    """
+    Redis-backed state shared across processes and hosts
+
+    Requires the `redis` package (redis.asyncio); it is imported on first
+    use. The client is not pickled - each worker process connects lazily.
+    """
+
+    def __init__(self, url: Optional[str] = None, prefix: str = "tnt:integrations"):
+        self.url = url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self.prefix = prefix
+        self._client = None
+        self._reserve = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"url": self.url, "prefix": self.prefix, "_client": None, "_reserve": None}
+
+    @property
+    def client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.url, decode_responses=True)
+        return self._client
+
+    async def reserve(self, service: str, rate_per_minute: float, burst: int = 1) -> float:
+        if rate_per_minute <= 0:
+            return 0.0
+
+        if self._reserve is None:
+            self._reserve = self.client.register_script(_RESERVE_SCRIPT)
+        interval = 60.0 / rate_per_minute
+        tolerance = interval * (max(burst, 1) - 1)
+        wait = await self._reserve(keys=[f"{self.prefix}:ratelimit:{service}"], args=[interval, tolerance])
+        return float(wait)
+
+    async def publish_health(self, service: str, status: Dict[str, Any]) -> None:
+        await self.client.hset(f"{self.prefix}:health", service, json.dumps(status, default=str))
+
+    async def get_health(self) -> Dict[str, Dict[str, Any]]:
+        raw = await self.client.hgetall(f"{self.prefix}:health")
+        return {service: json.loads(value) for service, value in raw.items()}
+
+    async def close(self) -> None:
+        if self._client is not None:
+            # redis-py < 5 only has close()
+            await getattr(self._client, "aclose", self._client.close)()
+            self._client = None
+            self._reserve = None
+
+def create_state_backend(url: Optional[str] = None) -> SharedStateBackend:
+    """Redis when a redis:// URL is given or REDIS_URL is set, else a process-local stand-in"""
+    url = url or os.getenv("REDIS_URL")
+    if url and url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStateBackend(url)
+    return LocalStateBackend()
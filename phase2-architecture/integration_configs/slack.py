@@ -0,0 +1,112 @@
+"""
+Slack team notification configuration
+"""
+
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict
+
+from .base import IntegrationConfig, IntegrationType
+from .metrics import instrumented
+
+# =====================================================
+# SLACK INTEGRATION
+# =====================================================
+
+@dataclass
+class SlackConfig(IntegrationConfig):
+    """
+    Slack integration for team notifications
+
+    Business Requirements:
+    - Real-time high-value lead alerts
+    - Dispatcher team notifications
+    - System status updates
+    """
+
+    service_name: str = "slack"
+    integration_type: IntegrationType = IntegrationType.NOTIFICATION
+
+    # Webhook Configuration
+    webhook_url: str = field(default_factory=lambda: os.getenv('SLACK_WEBHOOK_URL', ''))
+    channel: str = "#tnt-leads"
+    username: str = "TNT Lead Bot"
+    icon_emoji: str = ":car:"
+
+    # Notification Configuration
+    notify_high_value_leads: bool = True
+    high_value_threshold: float = 1000.0
+    notify_system_errors: bool = True
+    notify_integration_failures: bool = True
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.service_name = "slack"
+        self.integration_type = IntegrationType.NOTIFICATION
+
+    @instrumented("format")
+    def format_lead_notification(self, tnt_lead: Dict[str, Any]) -> Dict[str, Any]:
+        """Format lead data for Slack notification"""
+
+        # Determine notification color based on lead score
+        score = tnt_lead.get("lead_score", 0)
+        if score >= 80:
+            color = "danger"  # Red for critical
+        elif score >= 60:
+            color = "warning"  # Orange for high
+        else:
+            color = "good"    # Green for medium
+
+        # Build attachment
+        attachment = {
+            "color": color,
+            "title": f"🚗 New {tnt_lead.get('service_type', 'Lead').title()} Lead",
+            "title_link": f"{os.getenv('TNT_DASHBOARD_URL')}/leads/{tnt_lead.get('lead_id')}",
+            "fields": [
+                {
+                    "title": "Company",
+                    "value": tnt_lead.get("company_name", "Individual"),
+                    "short": True
+                },
+                {
+                    "title": "Contact",
+                    "value": tnt_lead.get("contact_name"),
+                    "short": True
+                },
+                {
+                    "title": "Estimated Value",
+                    "value": f"${tnt_lead.get('estimated_value', 0):.2f}",
+                    "short": True
+                },
+                {
+                    "title": "Lead Score",
+                    "value": f"{score}/100",
+                    "short": True
+                },
+                {
+                    "title": "Service Date",
+                    "value": tnt_lead.get("service_date", "TBD"),
+                    "short": True
+                },
+                {
+                    "title": "Pickup",
+                    "value": tnt_lead.get("pickup_location", "Not specified"),
+                    "short": False
+                }
+            ],
+            "footer": "TNT Lead System",
+            "ts": int(datetime.utcnow().timestamp())
+        }
+
+        # Add urgent action message for high-value leads
+        if tnt_lead.get("estimated_value", 0) >= self.high_value_threshold:
+            attachment["pretext"] = "🚨 *HIGH VALUE LEAD ALERT* 🚨"
+
+        return {
+            "channel": self.channel,
+            "username": self.username,
+            "icon_emoji": self.icon_emoji,
+            "text": f"New lead from {tnt_lead.get('contact_name')} at {tnt_lead.get('company_name', 'N/A')}",
+            "attachments": [attachment]
+        }
@@ -0,0 +1,69 @@
+"""
+SMS manager alert configuration (Twilio)
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from .base import IntegrationConfig, IntegrationType
+from .metrics import instrumented
+
+# =====================================================
+# SMS NOTIFICATION INTEGRATION
+# =====================================================
+
+@dataclass
+class SMSConfig(IntegrationConfig):
+    """
+    SMS notification configuration for manager alerts
+
+    Business Requirements:
+    - Immediate SMS for high-value leads (>$1,000)
+    - Weekend/holiday coverage notifications
+    - System alert notifications
+    """
+
+    service_name: str = "sms_notifications"
+    integration_type: IntegrationType = IntegrationType.SMS
+
+    # SMS Provider Configuration (Twilio)
+    account_sid: str = field(default_factory=lambda: os.getenv('TWILIO_ACCOUNT_SID', ''))
+    auth_token: str = field(default_factory=lambda: os.getenv('TWILIO_AUTH_TOKEN', ''))
+    from_number: str = field(default_factory=lambda: os.getenv('TWILIO_FROM_NUMBER', ''))
+
+    # Notification Configuration
+    manager_numbers: List[str] = field(default_factory=lambda: [
+        os.getenv('TNT_MANAGER_PHONE_1', ''),
+        os.getenv('TNT_MANAGER_PHONE_2', '')
+    ])
+
+    high_value_threshold: float = 1000.0
+    send_weekend_alerts: bool = True
+    send_after_hours_alerts: bool = True
+    rate_limit_minutes: int = 5  # Minimum time between SMS to same number
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.service_name = "sms_notifications"
+        self.integration_type = IntegrationType.SMS
+        # Filter out empty phone numbers
+        self.manager_numbers = [num for num in self.manager_numbers if num]
+
+    @instrumented("format")
+    def format_lead_alert(self, tnt_lead: Dict[str, Any]) -> str:
+        """Format lead data for SMS alert"""
+        company = tnt_lead.get("company_name", "Individual")
+        contact = tnt_lead.get("contact_name", "Unknown")
+        value = tnt_lead.get("estimated_value", 0)
+        service_type = tnt_lead.get("service_type", "service")
+
+        message = f"🚨 TNT HIGH VALUE LEAD\n"
+        message += f"Company: {company}\n"
+        message += f"Contact: {contact}\n"
+        message += f"Value: ${value:.2f}\n"
+        message += f"Service: {service_type.title()}\n"
+        message += f"Score: {tnt_lead.get('lead_score', 0)}/100\n"
+        message += f"View: {os.getenv('TNT_DASHBOARD_URL')}/leads/{tnt_lead.get('lead_id')}"
+
+        return message
@@ -0,0 +1,140 @@
+"""
+Merging t-digest - compact, mergeable quantile sketch
+
+Used for response-time percentiles in the incremental metrics aggregator:
+per-day digests from several processes (or from the database) merge into one
+without keeping every observation. Accuracy is best at the tails (p95/p99),
+which is where the 5-minute SLA lives.
+
+Reference: Dunning & Ertl, "Computing Extremely Accurate Quantiles Using
+t-Digests" (merging variant, k1 scale function).
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+class TDigest:
+    """Merging t-digest with the arcsine (k1) scale function"""
+
+    def __init__(self, compression: float = 100.0):
+        self.compression = compression
+        self.count = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._centroids: List[Tuple[float, float]] = []  # (mean, weight), sorted by mean
+        self._buffer: List[Tuple[float, float]] = []
+        self._buffer_limit = int(5 * compression)
+
+    def __len__(self) -> int:
+        return int(self.count)
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self._buffer_limit:
+            self._compress()
+
+    def update(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "TDigest") -> None:
+        """Fold another digest into this one"""
+        if other.count == 0:
+            return
+        other._compress()
+        self._buffer.extend(other._centroids)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated value at quantile q (0-1), or None when empty"""
+        if self.count == 0:
+            return None
+        self._compress()
+
+        centroids = self._centroids
+        if len(centroids) == 1:
+            return centroids[0][0]
+
+        q = min(max(q, 0.0), 1.0)
+        target = q * self.count
+
+        first_mean, first_weight = centroids[0]
+        if target < first_weight / 2:
+            return self.min + (first_mean - self.min) * (target / (first_weight / 2))
+
+        last_mean, last_weight = centroids[-1]
+        if target > self.count - last_weight / 2:
+            tail = (self.count - target) / (last_weight / 2)
+            return self.max - (self.max - last_mean) * tail
+
+        # Interpolate between neighbouring centroid centers
+        cumulative = first_weight / 2
+        for (left_mean, left_weight), (right_mean, right_weight) in zip(centroids, centroids[1:]):
+            step = (left_weight + right_weight) / 2
+            if cumulative + step >= target:
+                fraction = (target - cumulative) / step if step else 0.0
+                return left_mean + (right_mean - left_mean) * fraction
+            cumulative += step
+        return last_mean
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form (stored in *_response_time_digest JSONB columns)"""
+        self._compress()
+        return {
+            "compression": self.compression,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "centroids": [[round(mean, 6), weight] for mean, weight in self._centroids],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "TDigest":
+        digest = cls(data.get("compression", 100.0) if data else 100.0)
+        if not data or not data.get("centroids"):
+            return digest
+
+        digest._centroids = [(float(mean), float(weight)) for mean, weight in data["centroids"]]
+        digest.count = sum(weight for _, weight in digest._centroids)
+        digest.min = float(data["min"]) if data.get("min") is not None else digest._centroids[0][0]
+        digest.max = float(data["max"]) if data.get("max") is not None else digest._centroids[-1][0]
+        return digest
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+
+        points = sorted(self._centroids + self._buffer)
+        self._buffer = []
+
+        total = self.count
+        merged: List[Tuple[float, float]] = []
+        mean, weight = points[0]
+        weight_so_far = 0.0
+        q_limit = self._k_inverse(self._k(0.0) + 1.0)
+
+        for next_mean, next_weight in points[1:]:
+            if (weight_so_far + weight + next_weight) / total <= q_limit:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                weight_so_far += weight
+                merged.append((mean, weight))
+                q_limit = self._k_inverse(self._k(weight_so_far / total) + 1.0)
+                mean, weight = next_mean, next_weight
+
+        merged.append((mean, weight))
+        self._centroids = merged
+
+    def _k(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _k_inverse(self, k: float) -> float:
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
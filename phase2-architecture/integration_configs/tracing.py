@@ -0,0 +1,679 @@
+"""
+Speed-to-lead tracing - end-to-end latency per lead across pipeline stages
+
+Business SLA: lead submission to automated response in under 5 minutes.
+Each lead gets one trace (keyed by lead_id) made of OpenTelemetry-compatible
+spans for the pipeline stages:
+
+    ingest -> scoring -> format -> fanout.<channel> -> smtp_accept
+
+Completed traces are kept in an in-process ring buffer, live p50/p95/p99
+latencies are reported per stage, and exporters (such as
+TraceBatchExporter) receive every finished trace.
+
+Usage:
+    tracer = get_lead_tracer()
+    tracer.start_trace(lead_id, submitted_at=lead["created_at"],
+                       service_type=lead["service_type"], source=lead["source"])
+
+    with tracer.span(lead_id, STAGE_SCORING):
+        ...
+    async with tracer.span(lead_id, STAGE_FANOUT, channel="email"):
+        ...
+
+    tracer.finish_trace(lead_id)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+from .metrics import DEFAULT_LATENCY_BUCKETS, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages
+STAGE_INGEST = "ingest"
+STAGE_SCORING = "scoring"
+STAGE_FORMAT = "format"
+STAGE_FANOUT = "fanout"
+STAGE_SMTP_ACCEPT = "smtp_accept"
+
+# Pseudo-stage for submission -> automated response
+STAGE_TOTAL = "total"
+
+SLA_SECONDS = 5 * 60
+
+# Lead fields copied onto the root span (as lead.<field>) by start_trace
+LEAD_DIMENSIONS = ("service_type", "source")
+
+# Fan-out channel -> lead_interactions.interaction_type
+CHANNEL_INTERACTION_TYPES: Dict[str, str] = {
+    "email": "email_sent",
+    "sms": "sms_sent",
+}
+
+# OpenTelemetry status codes (opentelemetry.proto.trace.v1.Status.StatusCode)
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# OpenTelemetry span kind: SPAN_KIND_INTERNAL
+SPAN_KIND_INTERNAL = 1
+
+Timestamp = Union[datetime, float, int]
+
+# =====================================================
+# SPANS AND TRACES
+# =====================================================
+
+class Span:
+    """One timed pipeline stage; field names follow the OTLP span model"""
+
+    __slots__ = ("trace_id", "span_id", "parent_span_id", "name", "stage", "channel",
+                 "attributes", "start_time_unix_nano", "end_time_unix_nano",
+                 "duration_ns", "status_code", "status_message")
+
+    def __init__(self, trace_id: str, name: str, stage: str,
+                 channel: Optional[str] = None,
+                 parent_span_id: Optional[str] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.stage = stage
+        self.channel = channel
+        self.attributes: Dict[str, Any] = attributes or {}
+        self.start_time_unix_nano = 0
+        self.end_time_unix_nano: Optional[int] = None
+        self.duration_ns: Optional[int] = None
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        return None if self.duration_ns is None else self.duration_ns / 1e9
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Serialize as an OTLP/JSON span"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano or self.start_time_unix_nano),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+class LeadTrace:
+    """All spans for one lead, from submission to automated response"""
+
+    def __init__(self, lead_id: str, submitted_at_unix_nano: int):
+        self.lead_id = lead_id
+        self.trace_id = os.urandom(16).hex()
+        self.spans: List[Span] = []
+        self.root = Span(self.trace_id, "speed_to_lead", STAGE_TOTAL, attributes={"lead.id": lead_id})
+        self.root.start_time_unix_nano = submitted_at_unix_nano
+        self.finished = False
+        self.opened_at = time.monotonic()
+        self._response_end_unix_nano: Optional[int] = None  # frozen by finish()
+
+    @property
+    def submitted_at(self) -> datetime:
+        return datetime.fromtimestamp(self.root.start_time_unix_nano / 1e9, tz=timezone.utc)
+
+    @property
+    def response_seconds(self) -> Optional[float]:
+        """
+        Submission to the first automated response reaching the lead: the
+        first SMTP accept, else the first successful email/SMS fan-out.
+        None when no such response succeeded.
+        """
+        end_ns = self.response_end_unix_nano
+        if end_ns is None:
+            return None
+        return max(end_ns - self.root.start_time_unix_nano, 0) / 1e9
+
+    @property
+    def response_end_unix_nano(self) -> Optional[int]:
+        """End of the first automated response; fixed once the trace is finished"""
+        if self.finished:
+            return self._response_end_unix_nano
+        return self._first_response_end()
+
+    def finish(self, end_time_unix_nano: int) -> None:
+        """Close the root span and freeze the SLA result against late spans"""
+        self._response_end_unix_nano = self._first_response_end()
+        self.root.end_time_unix_nano = end_time_unix_nano
+        self.root.duration_ns = end_time_unix_nano - self.root.start_time_unix_nano
+        self.finished = True
+
+    def _first_response_end(self) -> Optional[int]:
+        # Internal fan-outs (crm, dispatch, slack) never answer the lead
+        for stage, channels in ((STAGE_SMTP_ACCEPT, None), (STAGE_FANOUT, CHANNEL_INTERACTION_TYPES)):
+            ends = [span.end_time_unix_nano for span in self.spans
+                    if span.stage == stage and span.end_time_unix_nano is not None
+                    and span.status_code != STATUS_ERROR
+                    and (channels is None or span.channel in channels)]
+            if ends:
+                return min(ends)
+        return None
+
+    @property
+    def sla_met(self) -> Optional[bool]:
+        """None while the trace is open and unanswered; a finished unanswered lead misses the SLA"""
+        seconds = self.response_seconds
+        if seconds is None:
+            return False if self.finished else None
+        return seconds <= SLA_SECONDS
+
+    def response_interactions(self) -> List[Tuple[str, int]]:
+        """(interaction_type, end unix nanos) per successful email/SMS fan-out"""
+        return [
+            (CHANNEL_INTERACTION_TYPES[span.channel], span.end_time_unix_nano)
+            for span in self.spans
+            if span.stage == STAGE_FANOUT and span.channel in CHANNEL_INTERACTION_TYPES
+            and span.status_code != STATUS_ERROR and span.end_time_unix_nano is not None
+        ]
+
+    def lead_dimensions(self) -> Dict[str, str]:
+        """service_type/source recorded by start_trace, for per-dimension metrics"""
+        return {
+            dimension: self.root.attributes[f"lead.{dimension}"]
+            for dimension in LEAD_DIMENSIONS
+            if self.root.attributes.get(f"lead.{dimension}")
+        }
+
+    def stage_timings_ms(self) -> Dict[str, float]:
+        """Total milliseconds per stage key (fan-out keyed per channel)"""
+        timings: Dict[str, float] = {}
+        for span in self.spans:
+            if span.duration_ns is not None:
+                key = _stage_key(span.stage, span.channel)
+                timings[key] = round(timings.get(key, 0.0) + span.duration_ns / 1e6, 3)
+        return timings
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Serialize as an OTLP/JSON ResourceSpans payload"""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", "tnt-lead-system")]},
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [self.root.to_otlp()] + [span.to_otlp() for span in self.spans],
+                }],
+            }],
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "lead_id": self.lead_id,
+            "trace_id": self.trace_id,
+            "submitted_at": self.submitted_at.isoformat(),
+            "response_seconds": self.response_seconds,
+            "sla_met": self.sla_met,
+            "stage_timings_ms": self.stage_timings_ms(),
+        }
+
+class SpanContext:
+    """Times one span on the monotonic clock; usable with `with` and `async with`"""
+
+    __slots__ = ("tracer", "trace", "span", "_start_perf_ns")
+
+    def __init__(self, tracer: "LeadTracer", trace: LeadTrace, span: Span):
+        self.tracer = tracer
+        self.trace = trace
+        self.span = span
+        self._start_perf_ns = 0
+
+    def __enter__(self) -> Span:
+        self.span.start_time_unix_nano = time.time_ns()
+        self._start_perf_ns = time.perf_counter_ns()
+        return self.span
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        duration_ns = time.perf_counter_ns() - self._start_perf_ns
+        if exc is not None:
+            self.span.status_code = STATUS_ERROR
+            self.span.status_message = f"{type(exc).__name__}: {exc}"
+        elif self.span.status_code == STATUS_UNSET:
+            self.span.status_code = STATUS_OK
+        self.tracer._end_span(self.trace, self.span, duration_ns)
+        return False
+
+    async def __aenter__(self) -> Span:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, traceback) -> bool:
+        return self.__exit__(exc_type, exc, traceback)
+
+# =====================================================
+# TRACER
+# =====================================================
+
+class LeadTracer:
+    """
+    Collects per-lead traces and live per-stage latency percentiles
+
+    Active traces are held by lead_id until finish_trace(); finished traces
+    go to a bounded ring buffer and to every registered exporter. Traces
+    never finished are dropped after active_ttl_seconds, or oldest first
+    once max_active are open.
+    """
+
+    def __init__(self,
+                 capacity: int = 1000,
+                 sla_seconds: float = SLA_SECONDS,
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+                 max_active: int = 10000,
+                 active_ttl_seconds: float = 2 * 60 * 60):
+        self.sla_seconds = sla_seconds
+        self.max_active = max_active
+        self.active_ttl_seconds = active_ttl_seconds
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._active: Dict[str, LeadTrace] = {}
+        self._recent: Deque[LeadTrace] = deque(maxlen=capacity)
+        self._stage_latency: Dict[str, Histogram] = {}
+        self._exporters: List[Callable[[LeadTrace], None]] = []
+        self.traces_finished = 0
+        self.sla_violations = 0
+        self.unanswered = 0
+        self.traces_abandoned = 0
+
+    # -------------------------------------------------
+    # Trace lifecycle
+    # -------------------------------------------------
+
+    def start_trace(self, lead_id: str, submitted_at: Optional[Timestamp] = None,
+                    service_type: Optional[str] = None, source: Optional[str] = None) -> LeadTrace:
+        """
+        Open a trace for a lead; submitted_at defaults to now. service_type
+        and source feed the per-dimension rows of daily_metrics_breakdown.
+        """
+        with self._lock:
+            trace = self._active.get(lead_id)
+            if trace is None:
+                self._evict_stale()
+                trace = LeadTrace(lead_id, _to_unix_nano(submitted_at))
+                self._active[lead_id] = trace
+            for dimension, value in (("service_type", service_type), ("source", source)):
+                if value:
+                    trace.root.attributes[f"lead.{dimension}"] = str(value)
+            return trace
+
+    def span(self, lead_id: str, stage: str, channel: Optional[str] = None,
+             **attributes: Any) -> SpanContext:
+        """
+        Context manager timing one stage of a lead's pipeline. A span for a
+        lead whose trace already finished (a late SMTP accept, a webhook) is
+        attached to that trace without changing its SLA result.
+        """
+        trace = self.get_trace(lead_id) or self._finished_trace(lead_id) or self.start_trace(lead_id)
+
+        span_attributes = {"lead.id": lead_id, "tnt.stage": stage}
+        if channel:
+            span_attributes["tnt.channel"] = channel
+        span_attributes.update(attributes)
+
+        span = Span(trace.trace_id, _stage_key(stage, channel), stage, channel,
+                    parent_span_id=trace.root.span_id, attributes=span_attributes)
+        return SpanContext(self, trace, span)
+
+    def record_span(self, lead_id: str, stage: str, duration_seconds: float,
+                    channel: Optional[str] = None, end_time: Optional[Timestamp] = None,
+                    error: Optional[str] = None, **attributes: Any) -> Span:
+        """Record a stage timed elsewhere (e.g. by a worker process or webhook)"""
+        context = self.span(lead_id, stage, channel, **attributes)
+        span = context.span
+        duration_ns = int(duration_seconds * 1e9)
+        span.start_time_unix_nano = _to_unix_nano(end_time) - duration_ns
+        span.status_code = STATUS_ERROR if error else STATUS_OK
+        span.status_message = error or ""
+        self._end_span(context.trace, span, duration_ns)
+        return span
+
+    def finish_trace(self, lead_id: str) -> Optional[LeadTrace]:
+        """Close a lead's trace, update SLA statistics and notify exporters"""
+        with self._lock:
+            trace = self._active.pop(lead_id, None)
+            if trace is None:
+                return None
+
+            trace.finish(time.time_ns())
+
+            response_seconds = trace.response_seconds
+            if response_seconds is None:
+                # No email/SMS reached the lead: a violation, not a fast response
+                self.unanswered += 1
+                self.sla_violations += 1
+                trace.root.status_code = STATUS_ERROR
+                trace.root.status_message = "No automated response"
+            else:
+                self._observe(STAGE_TOTAL, response_seconds)
+                if response_seconds > self.sla_seconds:
+                    self.sla_violations += 1
+                    trace.root.status_code = STATUS_ERROR
+                    trace.root.status_message = "SLA exceeded"
+                else:
+                    trace.root.status_code = STATUS_OK
+
+            self.traces_finished += 1
+            self._recent.append(trace)
+            exporters = list(self._exporters)
+
+        for exporter in exporters:
+            try:
+                exporter(trace)
+            except Exception as e:
+                # Never let telemetry failures break lead processing
+                logger.error(f"Trace exporter failed for lead {lead_id}: {str(e)}")
+        return trace
+
+    def get_trace(self, lead_id: str) -> Optional[LeadTrace]:
+        with self._lock:
+            return self._active.get(lead_id)
+
+    # -------------------------------------------------
+    # Reporting
+    # -------------------------------------------------
+
+    def add_exporter(self, exporter: Callable[[LeadTrace], None]) -> None:
+        """Register a callable that receives every finished trace"""
+        with self._lock:
+            self._exporters.append(exporter)
+
+    def recent_traces(self, limit: Optional[int] = None) -> List[LeadTrace]:
+        """Most recently finished traces, newest last"""
+        with self._lock:
+            traces = list(self._recent)
+        return traces if limit is None else traces[-limit:]
+
+    def stage_percentiles(self) -> Dict[str, Dict[str, Any]]:
+        """Live count and p50/p95/p99 (ms) per stage, plus end-to-end 'total'"""
+        with self._lock:
+            return {
+                stage: {
+                    "count": histogram.count,
+                    "p50_ms": _to_ms(histogram.quantile(0.50)),
+                    "p95_ms": _to_ms(histogram.quantile(0.95)),
+                    "p99_ms": _to_ms(histogram.quantile(0.99)),
+                }
+                for stage, histogram in sorted(self._stage_latency.items())
+            }
+
+    def sla_report(self) -> Dict[str, Any]:
+        with self._lock:
+            finished = self.traces_finished
+            violations = self.sla_violations
+            unanswered = self.unanswered
+            abandoned = self.traces_abandoned
+            active = len(self._active)
+        return {
+            "sla_seconds": self.sla_seconds,
+            "traces_finished": finished,
+            "sla_violations": violations,
+            "unanswered": unanswered,
+            "sla_compliance_rate": round(100.0 * (finished - violations) / finished, 2) if finished else None,
+            "active_traces": active,
+            "traces_abandoned": abandoned,
+        }
+
+    # -------------------------------------------------
+    # Internal helpers
+    # -------------------------------------------------
+
+    def _finished_trace(self, lead_id: str) -> Optional[LeadTrace]:
+        with self._lock:
+            for trace in reversed(self._recent):
+                if trace.lead_id == lead_id:
+                    logger.debug(f"Late span for lead {lead_id} attached to finished trace {trace.trace_id}")
+                    return trace
+        return None
+
+    def _evict_stale(self) -> None:
+        """Drop traces never finished; caller holds the lock"""
+        cutoff = time.monotonic() - self.active_ttl_seconds
+        while self._active:
+            lead_id, oldest = next(iter(self._active.items()))  # dicts keep insertion order
+            if oldest.opened_at >= cutoff and len(self._active) < self.max_active:
+                break
+            del self._active[lead_id]
+            self.traces_abandoned += 1
+            logger.warning(f"Dropped unfinished trace for lead {lead_id}")
+
+    def _end_span(self, trace: LeadTrace, span: Span, duration_ns: int) -> None:
+        span.duration_ns = duration_ns
+        span.end_time_unix_nano = span.start_time_unix_nano + duration_ns
+        with self._lock:
+            trace.spans.append(span)
+            self._observe(_stage_key(span.stage, span.channel), duration_ns / 1e9)
+
+    def _observe(self, stage: str, seconds: float) -> None:
+        histogram = self._stage_latency.get(stage)
+        if histogram is None:
+            histogram = self._stage_latency[stage] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+# =====================================================
+# DATABASE EXPORTER
+# =====================================================
+
+INSERT_INTERACTION_SQL = """
+INSERT INTO lead_interactions
+    (lead_id, interaction_type, automated, template_used, trace_id, stage_timings, created_at, completed_at)
+VALUES (%s, %s, true, %s, %s, %s, %s, %s)
+"""
+
+UPSERT_DAILY_METRICS_SQL = """
+INSERT INTO daily_metrics
+    (metric_date, traced_responses, responses_measured, responses_under_5min, sla_violations,
+     response_time_sum_minutes, avg_response_time_minutes, calculated_at)
+VALUES (%s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+ON CONFLICT (metric_date) DO UPDATE SET
+    avg_response_time_minutes = ROUND(
+        (COALESCE(daily_metrics.response_time_sum_minutes, 0) + EXCLUDED.response_time_sum_minutes)
+        / NULLIF(COALESCE(daily_metrics.responses_measured, 0) + EXCLUDED.responses_measured, 0), 2),
+    traced_responses = COALESCE(daily_metrics.traced_responses, 0) + EXCLUDED.traced_responses,
+    responses_measured = COALESCE(daily_metrics.responses_measured, 0) + EXCLUDED.responses_measured,
+    response_time_sum_minutes = COALESCE(daily_metrics.response_time_sum_minutes, 0) + EXCLUDED.response_time_sum_minutes,
+    responses_under_5min = COALESCE(daily_metrics.responses_under_5min, 0) + EXCLUDED.responses_under_5min,
+    sla_violations = COALESCE(daily_metrics.sla_violations, 0) + EXCLUDED.sla_violations,
+    calculated_at = CURRENT_TIMESTAMP
+"""
+
+class TraceBatchExporter:
+    """
+    Writes finished traces to PostgreSQL in batches
+
+    - lead_interactions: one automated row per successful fan-out channel
+      (email_sent / sms_sent) with the trace's stage timings, timestamped at
+      the response so response_time_metrics picks it up. The exporter is
+      the only writer of these rows for traced sends: the sending code must
+      not insert its own, and aggregator.record_trace counts the same rows.
+    - daily_metrics: off by default, since the MetricsAggregator owns
+      daily_metrics (register aggregator.record_trace alongside this
+      exporter). write_daily_metrics=True upserts per-day traced response
+      counts, SLA violations and response-time sums for deployments
+      without an aggregator; it does not maintain the response-time
+      digest or p50/p95/p99.
+
+    `connection` is any DB-API 2.0 connection using the %s paramstyle
+    (psycopg2, psycopg). Register with LeadTracer.add_exporter(exporter).
+
+    Call start() to write batches from a background thread; otherwise a
+    full batch is written synchronously inside finish_trace(), on the
+    lead-processing thread. A failed write keeps its traces pending for
+    the next attempt.
+    """
+
+    def __init__(self, connection, batch_size: int = 100, template_used: str = "speed_to_lead",
+                 write_daily_metrics: bool = False):
+        self.connection = connection
+        self.write_daily_metrics = write_daily_metrics
+        self.batch_size = batch_size
+        self.template_used = template_used
+        self._pending: List[LeadTrace] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __call__(self, trace: LeadTrace) -> None:
+        with self._lock:
+            self._pending.append(trace)
+            if len(self._pending) < self.batch_size:
+                return
+            if self._thread is not None:
+                self._wake.set()  # the flush thread writes it
+                return
+        self.flush()
+
+    def flush(self) -> int:
+        """Write all pending traces; returns the number written"""
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                self._write(batch)
+            except Exception:
+                # Keep the traces, ahead of any that arrived meanwhile
+                with self._lock:
+                    self._pending[:0] = batch
+                raise
+        return len(batch)
+
+    def start(self, interval_seconds: float = 5.0) -> None:
+        """Flush from a daemon thread every interval, or as soon as a batch fills"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval_seconds,), name="tnt-trace-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flush thread and write any remaining traces"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self, interval_seconds: float) -> None:
+        while not self._stop_event.is_set():
+            self._wake.wait(interval_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Trace export failed: {str(e)}")
+                self._stop_event.wait(interval_seconds)  # back off before retrying
+
+    def _write(self, batch: List[LeadTrace]) -> None:
+        interaction_rows = []
+        daily: Dict[Any, Dict[str, float]] = {}
+
+        for trace in batch:
+            timings = json.dumps(trace.stage_timings_ms())
+
+            for interaction_type, end_unix_nano in trace.response_interactions():
+                completed_at = _from_unix_nano(end_unix_nano)
+                interaction_rows.append((
+                    trace.lead_id, interaction_type, self.template_used,
+                    trace.trace_id, timings, completed_at, completed_at,
+                ))
+
+            day = daily.setdefault(trace.submitted_at.date(),
+                                   {"count": 0, "under": 0, "violations": 0, "minutes": 0.0})
+            response_seconds = trace.response_seconds
+            if response_seconds is None:
+                day["violations"] += 1  # unanswered: counted against the SLA, not measured
+                continue
+            day["count"] += 1
+            day["minutes"] += response_seconds / 60
+            if response_seconds <= SLA_SECONDS:
+                day["under"] += 1
+            else:
+                day["violations"] += 1
+
+        daily_rows = [
+            (metric_date, int(day["count"]), int(day["count"]), int(day["under"]), int(day["violations"]),
+             round(day["minutes"], 2), round(day["minutes"] / day["count"], 2) if day["count"] else None)
+            for metric_date, day in sorted(daily.items())
+        ] if self.write_daily_metrics else []
+
+        cursor = self.connection.cursor()
+        try:
+            if interaction_rows:
+                cursor.executemany(INSERT_INTERACTION_SQL, interaction_rows)
+            if daily_rows:
+                cursor.executemany(UPSERT_DAILY_METRICS_SQL, daily_rows)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+# =====================================================
+# PROCESS-WIDE TRACER
+# =====================================================
+
+_default_tracer = LeadTracer()
+
+def get_lead_tracer() -> LeadTracer:
+    """Return the process-wide lead tracer"""
+    return _default_tracer
+
+# =====================================================
+# HELPERS
+# =====================================================
+
+def _stage_key(stage: str, channel: Optional[str]) -> str:
+    return f"{stage}.{channel}" if channel else stage
+
+def _to_unix_nano(value: Optional[Timestamp]) -> int:
+    if value is None:
+        return time.time_ns()
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)  # Schema timestamps are naive UTC
+        return int(value.timestamp() * 1e9)
+    return int(value * 1e9)
+
+def _from_unix_nano(value: int) -> datetime:
+    """Naive UTC datetime, matching the schema's TIMESTAMP columns"""
+    return datetime.utcfromtimestamp(value / 1e9)
+
+def _to_ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 3)
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
@@ -0,0 +1,50 @@
+"""
+Utility functions for integration credentials and environment validation
+"""
+
+import os
+from typing import Dict
+
+from .vault import get_credential_vault
+
+# =====================================================
+# UTILITY FUNCTIONS
+# =====================================================
+
+def encrypt_sensitive_data(data: str) -> str:
+    """Encrypt sensitive configuration data"""
+    return get_credential_vault().encrypt(data)
+
+def decrypt_sensitive_data(encrypted_data: str) -> str:
+    """Decrypt sensitive configuration data"""
+    return get_credential_vault().decrypt(encrypted_data)
+
+def validate_environment_variables() -> Dict[str, bool]:
+    """Validate that required environment variables are set"""
+    required_vars = {
+        'INTEGRATION_ENCRYPTION_KEY': os.getenv('INTEGRATION_ENCRYPTION_KEY'),
+        'TNT_WEBHOOK_URL': os.getenv('TNT_WEBHOOK_URL'),
+        'TNT_API_URL': os.getenv('TNT_API_URL'),
+        'TNT_DASHBOARD_URL': os.getenv('TNT_DASHBOARD_URL')
+    }
+
+    # Optional but recommended variables
+    optional_vars = {
+        'ZOHO_CLIENT_ID': os.getenv('ZOHO_CLIENT_ID'),
+        'FASTTRACK_API_ENDPOINT': os.getenv('FASTTRACK_API_ENDPOINT'),
+        'RICHWEB_SMTP_USERNAME': os.getenv('RICHWEB_SMTP_USERNAME'),
+        'SLACK_WEBHOOK_URL': os.getenv('SLACK_WEBHOOK_URL'),
+        'TWILIO_ACCOUNT_SID': os.getenv('TWILIO_ACCOUNT_SID')
+    }
+
+    validation_results = {}
+
+    # Check required variables
+    for var_name, var_value in required_vars.items():
+        validation_results[var_name] = bool(var_value)
+
+    # Check optional variables
+    for var_name, var_value in optional_vars.items():
+        validation_results[f"{var_name}_optional"] = bool(var_value)
+
+    return validation_results
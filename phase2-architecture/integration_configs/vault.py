@@ -0,0 +1,203 @@
+"""
+Credential vault - cached Fernet cipher and bulk credential encryption
+
+Builds the cipher once per process instead of on every call, supports key
+rotation through MultiFernet, and keeps decrypted secrets in a bounded
+TTL cache so per-request or per-sync-job credential lookups stay cheap.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Comma-separated list of Fernet keys, newest first. The first key encrypts;
+# every key is tried when decrypting so old ciphertexts survive a rotation.
+ENCRYPTION_KEY_ENV = 'INTEGRATION_ENCRYPTION_KEY'
+
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+
+# =====================================================
+# CREDENTIAL VAULT
+# =====================================================
+
+class CredentialVault:
+    """
+    Encrypts and decrypts integration credentials with a single cached cipher
+
+    Decrypted values are held in an LRU cache bounded by entry count and TTL,
+    keyed by ciphertext. Set cache_ttl_seconds to 0 to disable caching.
+    """
+
+    def __init__(self,
+                 keys: List[str],
+                 cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+                 cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        keys = [key.strip() for key in keys if key and key.strip()]
+        if not keys:
+            raise ValueError("Encryption key not found")
+
+        self._keys = keys
+        self._cipher = None
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = cache_max_entries
+        self._cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls, **kwargs: Any) -> "CredentialVault":
+        """Build a vault from INTEGRATION_ENCRYPTION_KEY"""
+        value = os.getenv(ENCRYPTION_KEY_ENV)
+        if not value:
+            raise ValueError(f"{ENCRYPTION_KEY_ENV} environment variable required")
+        return cls(value.split(','), **kwargs)
+
+    @property
+    def cipher(self):
+        """Fernet (single key) or MultiFernet (rotation) cipher, built on first use"""
+        if self._cipher is None:
+            from cryptography.fernet import Fernet, MultiFernet
+
+            fernets = [Fernet(key.encode()) for key in self._keys]
+            self._cipher = fernets[0] if len(fernets) == 1 else MultiFernet(fernets)
+        return self._cipher
+
+    # -------------------------------------------------
+    # Single-value API
+    # -------------------------------------------------
+
+    def encrypt(self, data: str) -> str:
+        """Encrypt a value with the primary key"""
+        return self.cipher.encrypt(data.encode()).decode()
+
+    def decrypt(self, encrypted_data: str) -> str:
+        """Decrypt a value, serving repeated lookups from the cache"""
+        return self.decrypt_many([encrypted_data])[0]
+
+    def rotate(self, encrypted_data: str) -> str:
+        """Re-encrypt a value under the primary key"""
+        from cryptography.fernet import MultiFernet
+
+        cipher = self.cipher
+        if not isinstance(cipher, MultiFernet):
+            return encrypted_data
+        return cipher.rotate(encrypted_data.encode()).decode()
+
+    # -------------------------------------------------
+    # Bulk API
+    # -------------------------------------------------
+
+    def encrypt_many(self, values: Iterable[str]) -> List[str]:
+        """Encrypt several values with one cipher lookup"""
+        cipher = self.cipher
+        return [cipher.encrypt(value.encode()).decode() for value in values]
+
+    def decrypt_many(self, encrypted_values: Iterable[str]) -> List[str]:
+        """Decrypt several values, only running the cipher on cache misses"""
+        encrypted_values = list(encrypted_values)
+        results: List[Optional[str]] = [None] * len(encrypted_values)
+        misses: Dict[str, List[int]] = {}
+
+        now = time.monotonic()
+        with self._lock:
+            for index, token in enumerate(encrypted_values):
+                cached = self._cache_get(token, now)
+                if cached is None:
+                    misses.setdefault(token, []).append(index)
+                else:
+                    results[index] = cached
+
+        if misses:
+            cipher = self.cipher
+            decrypted = {token: cipher.decrypt(token.encode()).decode() for token in misses}
+
+            now = time.monotonic()
+            with self._lock:
+                for token, plaintext in decrypted.items():
+                    self._cache_put(token, plaintext, now)
+                    for index in misses[token]:
+                        results[index] = plaintext
+
+        return results
+
+    def encrypt_fields(self, fields: Dict[str, Any], keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Return a copy of fields with the given (default: all string) values encrypted"""
+        selected = self._select_fields(fields, keys)
+        encrypted = dict(fields)
+        encrypted.update(zip(selected, self.encrypt_many(fields[name] for name in selected)))
+        return encrypted
+
+    def decrypt_fields(self, fields: Dict[str, Any], keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Return a copy of fields with the given (default: all string) values decrypted
+
+        Intended for external_integrations.credentials rows, so a sync job can
+        decrypt every credential for an integration in a single call.
+        """
+        selected = self._select_fields(fields, keys)
+        decrypted = dict(fields)
+        decrypted.update(zip(selected, self.decrypt_many(fields[name] for name in selected)))
+        return decrypted
+
+    def clear_cache(self) -> None:
+        """Drop all cached plaintext"""
+        with self._lock:
+            self._cache.clear()
+
+    # -------------------------------------------------
+    # Internal helpers
+    # -------------------------------------------------
+
+    @staticmethod
+    def _select_fields(fields: Dict[str, Any], keys: Optional[Iterable[str]]) -> List[str]:
+        if keys is None:
+            return [name for name, value in fields.items() if isinstance(value, str) and value]
+        return [name for name in keys if fields.get(name)]
+
+    def _cache_get(self, token: str, now: float) -> Optional[str]:
+        entry = self._cache.get(token)
+        if entry is None:
+            return None
+
+        expires_at, plaintext = entry
+        if expires_at <= now:
+            del self._cache[token]
+            return None
+
+        self._cache.move_to_end(token)
+        return plaintext
+
+    def _cache_put(self, token: str, plaintext: str, now: float) -> None:
+        if self.cache_ttl_seconds <= 0 or self.cache_max_entries <= 0:
+            return
+
+        self._cache[token] = (now + self.cache_ttl_seconds, plaintext)
+        self._cache.move_to_end(token)
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+
+# =====================================================
+# PROCESS-WIDE VAULT
+# =====================================================
+
+_default_vault: Optional[CredentialVault] = None
+_default_vault_lock = threading.Lock()
+
+def get_credential_vault() -> CredentialVault:
+    """Return the process-wide vault, building it from the environment once"""
+    global _default_vault
+
+    if _default_vault is None:
+        with _default_vault_lock:
+            if _default_vault is None:
+                _default_vault = CredentialVault.from_environment()
+    return _default_vault
+
+def reset_credential_vault() -> None:
+    """Forget the process-wide vault so the next lookup re-reads the environment"""
+    global _default_vault
+
+    with _default_vault_lock:
+        _default_vault = None
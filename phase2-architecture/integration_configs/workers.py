@@ -0,0 +1,518 @@
+"""
+Integration worker runtime - sharded multi-process delivery
+
+Runs N worker processes, each with its own event loop, IntegrationManager and
+HTTP session. Deliveries are routed by a stable hash of lead_id, so all of a
+lead's deliveries run in submission order on one worker while different
+leads spread across cores.
+
+- Graceful drain: stop() lets every worker finish its queue before exiting
+- Supervision: a crashed worker is restarted and replays its unfinished jobs
+- Shared state: rate limits and health go through a SharedStateBackend
+  (Redis when REDIS_URL is set, otherwise a multiprocessing.Manager stand-in)
+- Rate limits: each job waits for its service's shared rate-limit slot
+  before taking one of the worker's concurrency slots, so a throttled
+  service does not starve the others
+
+Usage:
+    async def deliver(job, context):
+        session = context.get_session()
+        ...
+
+    pool = WorkerPool(deliver, num_workers=4)
+    pool.start()
+    try:
+        pool.submit(lead["lead_id"], "slack", payload)
+    finally:
+        pool.stop(timeout=30)
+
+Workers are spawned, so the handler must be a module-level coroutine
+function and the calling script needs an `if __name__ == "__main__"` guard.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait as wait_for_connections
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+from .manager import IntegrationManager
+from .metrics import IntegrationMetrics, get_integration_metrics
+from .shared_state import LocalStateBackend, RedisStateBackend, SharedStateBackend
+
+logger = logging.getLogger(__name__)
+
+# Worker -> supervisor event kind
+EVENT_DONE = "done"
+
+# =====================================================
+# JOBS AND SHARDING
+# =====================================================
+
+@dataclass
+class DeliveryJob:
+    """One outbound delivery for a lead (CRM sync, email, Slack, SMS...)"""
+    lead_id: str
+    service: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    enqueued_at: float = field(default_factory=time.time)
+    attempts: int = 0  # > 0 when replayed after a worker crash
+
+def shard_for_lead(lead_id: Any, num_shards: int) -> int:
+    """Stable shard index for a lead (hash() is salted per process, so not usable here)"""
+    digest = hashlib.blake2b(str(lead_id).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % num_shards
+
+# =====================================================
+# WORKER PROCESS
+# =====================================================
+
+class WorkerContext:
+    """Per-process resources handed to the delivery handler"""
+
+    def __init__(self, worker_id: int, manager: IntegrationManager):
+        self.worker_id = worker_id
+        self.manager = manager
+        self.metrics: IntegrationMetrics = manager.metrics
+        self._session = None
+
+    def get_session(self):
+        """aiohttp ClientSession shared by every delivery on this worker"""
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+Handler = Callable[[DeliveryJob, WorkerContext], Awaitable[Any]]
+
+def _worker_main(worker_id: int, jobs, events, handler: Handler, state_backend: SharedStateBackend,
+                 concurrency: int, throttle: bool, replay: List[DeliveryJob],
+                 health_check_interval: Optional[float], metrics_port: Optional[int]) -> None:
+    """Process entry point: one event loop per worker"""
+    # Ctrl+C reaches the whole process group; the supervisor decides how to stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    if metrics_port is not None:
+        from .metrics import start_metrics_server
+        start_metrics_server(metrics_port)
+
+    asyncio.run(_run_worker(worker_id, jobs, events, handler, state_backend,
+                            concurrency, throttle, replay, health_check_interval))
+
+async def _run_worker(worker_id: int, jobs, events, handler: Handler, state_backend: SharedStateBackend,
+                      concurrency: int, throttle: bool, replay: List[DeliveryJob],
+                      health_check_interval: Optional[float]) -> None:
+    loop = asyncio.get_running_loop()
+    context = WorkerContext(worker_id, IntegrationManager(state_backend=state_backend))
+    reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"tnt-worker-{worker_id}-queue")
+
+    slots = asyncio.Semaphore(concurrency)
+    backlog = asyncio.Semaphore(concurrency * 4)  # jobs pulled off the queue but not finished
+    lead_tails: Dict[str, asyncio.Task] = {}
+    running: Set[asyncio.Task] = set()
+
+    async def run_job(job: DeliveryJob, previous: Optional[asyncio.Task]) -> None:
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])  # keep per-lead order
+            start_time = time.perf_counter()
+            error_type = None
+            try:
+                if throttle:
+                    # Wait out the rate limit before holding a concurrency slot;
+                    # a config or backend failure here fails the delivery too
+                    await context.manager.throttle(job.service)
+                async with slots:
+                    start_time = time.perf_counter()
+                    await handler(job, context)
+            except Exception as e:
+                error_type = type(e).__name__
+                logger.error(f"Worker {worker_id}: {job.service} delivery for lead {job.lead_id} failed: {e}")
+            events.send((EVENT_DONE, worker_id, job.job_id, time.perf_counter() - start_time, error_type))
+        finally:
+            backlog.release()
+
+    def dispatch(job: DeliveryJob) -> None:
+        task = loop.create_task(run_job(job, lead_tails.get(job.lead_id)))
+        lead_tails[job.lead_id] = task
+        running.add(task)
+
+        def forget(finished: asyncio.Task, lead_id: str = job.lead_id) -> None:
+            running.discard(finished)
+            if lead_tails.get(lead_id) is finished:
+                del lead_tails[lead_id]
+        task.add_done_callback(forget)
+
+    health_task = None
+    if health_check_interval:
+        health_task = loop.create_task(_health_check_loop(context.manager, health_check_interval))
+
+    try:
+        for job in replay:
+            await backlog.acquire()
+            dispatch(job)
+
+        while True:
+            await backlog.acquire()
+            job = await loop.run_in_executor(reader, jobs.get)
+            if job is None:  # drain sentinel
+                break
+            dispatch(job)
+
+        if running:
+            await asyncio.wait(running)
+    finally:
+        if health_task is not None:
+            health_task.cancel()
+        reader.shutdown(wait=False, cancel_futures=True)
+        await context.close()
+        await state_backend.close()
+        events.close()
+
+async def _health_check_loop(manager: IntegrationManager, interval: float) -> None:
+    while True:
+        try:
+            await manager.health_check_all()
+        except Exception as e:
+            logger.warning(f"Periodic health check failed: {e}")
+        await asyncio.sleep(interval)
+
+# =====================================================
+# SUPERVISOR
+# =====================================================
+
+@dataclass
+class _Shard:
+    worker_id: int
+    queue: Any = None
+    events: Any = None  # read end of the worker's event pipe
+    process: Any = None
+    pending: "OrderedDict[str, DeliveryJob]" = field(default_factory=OrderedDict)
+    restart_times: Deque[float] = field(default_factory=deque)
+    restart_at: Optional[float] = None
+    completed: int = 0
+    errors: int = 0
+    failed: bool = False
+
+class WorkerPool:
+    """
+    Supervises sharded integration worker processes
+
+    Every submitted job stays in its shard's pending list until the worker
+    reports it done. When a worker dies, its replacement gets a fresh queue
+    and replays the whole pending list in submission order, so per-lead
+    ordering holds and delivery is at-least-once; handlers should be
+    idempotent for jobs with attempts > 0.
+
+    A shard that crashes more than max_restarts times within restart_window
+    seconds is marked failed and rejects new jobs.
+
+    With throttle=True (default) each job first waits for a slot under its
+    service's rate_limit_per_minute, shared by all workers. Handlers should
+    not throttle again. Rate-limited jobs still count towards stop()'s
+    drain timeout.
+    """
+
+    def __init__(self,
+                 handler: Handler,
+                 num_workers: Optional[int] = None,
+                 state_backend: Optional[SharedStateBackend] = None,
+                 concurrency: int = 10,
+                 throttle: bool = True,
+                 max_restarts: int = 5,
+                 restart_window: float = 60.0,
+                 restart_backoff: float = 0.5,
+                 health_check_interval: Optional[float] = None,
+                 metrics_base_port: Optional[int] = None,
+                 metrics: Optional[IntegrationMetrics] = None,
+                 start_method: str = "spawn"):
+        if not inspect.iscoroutinefunction(handler):
+            raise TypeError("WorkerPool handler must be an async function taking (job, context)")
+
+        self.handler = handler
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.throttle = throttle
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.restart_backoff = restart_backoff
+        self.health_check_interval = health_check_interval
+        self.metrics_base_port = metrics_base_port
+        self.metrics = metrics or get_integration_metrics()
+        self.state_backend = state_backend
+
+        self._context = multiprocessing.get_context(start_method)
+        self._sync_manager = None
+        self._shards: List[_Shard] = []
+        self._lock = threading.RLock()
+        self._supervisor: Optional[threading.Thread] = None
+        self._accepting = False
+        self._draining = False
+        self._closed = threading.Event()
+        self._drained = threading.Event()
+
+    def __enter__(self) -> "WorkerPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.stop()
+
+    # -------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------
+
+    def start(self) -> None:
+        if self._supervisor is not None:
+            raise RuntimeError("WorkerPool already started")
+
+        if self.state_backend is None:
+            self.state_backend = self._default_state_backend()
+
+        self._shards = [_Shard(worker_id) for worker_id in range(self.num_workers)]
+        for shard in self._shards:
+            self._spawn(shard, replay=[])
+
+        self._accepting = True
+        self._supervisor = threading.Thread(target=self._supervise, name="tnt-worker-supervisor", daemon=True)
+        self._supervisor.start()
+        logger.info(f"Started {self.num_workers} integration workers")
+
+    def submit(self, lead_id: Any, service: str, payload: Optional[Dict[str, Any]] = None) -> DeliveryJob:
+        """Queue a delivery on the lead's shard"""
+        job = DeliveryJob(str(lead_id), service, payload or {})
+        shard = self._shards[shard_for_lead(job.lead_id, self.num_workers)] if self._shards else None
+
+        with self._lock:
+            if not self._accepting or shard is None:
+                raise RuntimeError("WorkerPool is not accepting jobs")
+            if shard.failed:
+                raise RuntimeError(f"Worker {shard.worker_id} has failed; lead {job.lead_id} cannot be delivered")
+            shard.pending[job.job_id] = job
+            shard.queue.put(job)
+        return job
+
+    def stop(self, timeout: float = 30.0) -> Dict[str, Any]:
+        """
+        Stop accepting jobs and let every worker finish its queue. Workers
+        still busy after `timeout` seconds are terminated; their jobs are
+        reported as undelivered. The timeout has to cover the rate-limited
+        backlog: N queued jobs for a service limited to R/minute need about
+        N / R minutes.
+        """
+        if self._supervisor is None:
+            return self.stats()
+
+        with self._lock:
+            self._accepting = False
+            self._draining = True
+            for shard in self._shards:
+                if not shard.failed:
+                    shard.queue.put(None)
+
+        drained = self._drained.wait(timeout)
+        self._closed.set()
+        self._supervisor.join()
+        self._supervisor = None
+
+        if not drained:
+            logger.warning(f"Integration workers did not drain within {timeout}s; terminating")
+            for shard in self._shards:
+                if shard.process is not None and shard.process.is_alive():
+                    shard.process.terminate()
+        for shard in self._shards:
+            if shard.process is not None:
+                shard.process.join(timeout=5)
+        self._process_events(block=False)
+
+        summary = self.stats()
+        for shard in self._shards:
+            shard.queue.close()
+            shard.queue.cancel_join_thread()
+            self._close_events(shard)
+        if self._sync_manager is not None:
+            self._sync_manager.shutdown()
+            self._sync_manager = None
+
+        logger.info(f"Integration workers stopped: {summary['completed']} completed, "
+                    f"{summary['undelivered']} undelivered")
+        return summary
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            workers = [{
+                "worker_id": shard.worker_id,
+                "pid": shard.process.pid if shard.process is not None else None,
+                "alive": shard.process is not None and shard.process.is_alive(),
+                "pending": len(shard.pending),
+                "completed": shard.completed,
+                "errors": shard.errors,
+                "restarts": len(shard.restart_times),
+                "failed": shard.failed,
+            } for shard in self._shards]
+
+        return {
+            "workers": workers,
+            "completed": sum(worker["completed"] for worker in workers),
+            "errors": sum(worker["errors"] for worker in workers),
+            "undelivered": sum(worker["pending"] for worker in workers),
+            "restarts": sum(worker["restarts"] for worker in workers),
+        }
+
+    # -------------------------------------------------
+    # Supervision
+    # -------------------------------------------------
+
+    def _default_state_backend(self) -> SharedStateBackend:
+        if os.getenv("REDIS_URL"):
+            return RedisStateBackend()
+        self._sync_manager = self._context.Manager()
+        return LocalStateBackend(self._sync_manager.dict(), self._sync_manager.Lock())
+
+    def _spawn(self, shard: _Shard, replay: List[DeliveryJob]) -> None:
+        metrics_port = None
+        if self.metrics_base_port is not None:
+            metrics_port = self.metrics_base_port + shard.worker_id
+
+        # One event pipe per worker: a worker killed mid-write can only
+        # corrupt its own pipe, never block the other workers' reports
+        shard.events, events_writer = self._context.Pipe(duplex=False)
+        shard.queue = self._context.Queue()
+        shard.process = self._context.Process(
+            target=_worker_main,
+            name=f"tnt-integration-worker-{shard.worker_id}",
+            args=(shard.worker_id, shard.queue, events_writer, self.handler, self.state_backend,
+                  self.concurrency, self.throttle, replay, self.health_check_interval if shard.worker_id == 0 else None,
+                  metrics_port),
+            daemon=True,
+        )
+        shard.process.start()
+        events_writer.close()  # the worker holds the only write end, so its exit reads as EOF
+
+    def _supervise(self) -> None:
+        while not self._closed.is_set():
+            self._process_events(block=True)
+            self._check_workers()
+
+    def _process_events(self, block: bool) -> None:
+        readers = {shard.events: shard for shard in self._shards if shard.events is not None}
+        if not readers:
+            if block:
+                time.sleep(0.2)
+            return
+
+        for reader in wait_for_connections(list(readers), timeout=0.2 if block else 0):
+            shard = readers[reader]
+            while shard.events is not None and reader.poll():
+                try:
+                    event = reader.recv()
+                except Exception:
+                    # EOF (worker exited) or a message cut short by a crash
+                    self._close_events(shard)
+                    break
+                self._handle_event(event)
+
+    def _close_events(self, shard: _Shard) -> None:
+        if shard.events is not None:
+            shard.events.close()
+            shard.events = None
+
+    def _handle_event(self, event: tuple) -> None:
+        kind, worker_id, job_id, seconds, error_type = event
+        if kind != EVENT_DONE:
+            return
+
+        shard = self._shards[worker_id]
+        with self._lock:
+            job = shard.pending.pop(job_id, None)
+            if job is None:
+                return  # duplicate report for a replayed job
+            shard.completed += 1
+            if error_type:
+                shard.errors += 1
+
+        self.metrics.observe_latency(job.service, "delivery", seconds)
+        if error_type:
+            self.metrics.record_error(job.service, "delivery", error_type)
+
+    def _check_workers(self) -> None:
+        now = time.monotonic()
+        all_done = True
+
+        for shard in self._shards:
+            self.metrics.set_queue_depth("worker_pool", len(shard.pending), queue=f"shard-{shard.worker_id}")
+            if shard.failed:
+                continue
+
+            if shard.restart_at is not None:
+                all_done = False
+                if now >= shard.restart_at:
+                    self._restart(shard)
+                continue
+
+            if shard.process.is_alive():
+                all_done = False
+                continue
+
+            if self._draining and shard.process.exitcode == 0:
+                continue  # drained and exited cleanly
+
+            # Crashed (or exited while it should still be serving)
+            all_done = False
+            self._process_events(block=False)
+            self._schedule_restart(shard, now)
+
+        if self._draining and all_done:
+            self._drained.set()
+
+    def _schedule_restart(self, shard: _Shard, now: float) -> None:
+        while shard.restart_times and now - shard.restart_times[0] > self.restart_window:
+            shard.restart_times.popleft()
+
+        if len(shard.restart_times) >= self.max_restarts:
+            with self._lock:
+                shard.failed = True
+            logger.error(f"Worker {shard.worker_id} crashed {len(shard.restart_times) + 1} times in "
+                         f"{self.restart_window:.0f}s; giving up with {len(shard.pending)} jobs pending")
+            return
+
+        delay = min(self.restart_backoff * (2 ** len(shard.restart_times)), 30.0)
+        shard.restart_times.append(now)
+        shard.restart_at = now + delay
+        logger.warning(f"Worker {shard.worker_id} exited with code {shard.process.exitcode}; "
+                       f"restarting in {delay:.1f}s")
+
+    def _restart(self, shard: _Shard) -> None:
+        with self._lock:
+            # The old queue may be wedged (its reader lock died with the worker),
+            # so start clean and replay everything the worker had not finished
+            shard.queue.close()
+            shard.queue.cancel_join_thread()
+            self._close_events(shard)
+
+            replay = list(shard.pending.values())
+            for job in replay:
+                job.attempts += 1
+
+            shard.restart_at = None
+            self._spawn(shard, replay)
+            if self._draining:
+                shard.queue.put(None)
+
+        logger.info(f"Restarted worker {shard.worker_id} (pid {shard.process.pid}), replaying {len(replay)} jobs")
@@ -0,0 +1,114 @@
+"""
+Zoho CRM integration configuration
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from .base import IntegrationConfig, IntegrationType
+from .metrics import instrumented
+
+# =====================================================
+# ZOHO CRM INTEGRATION
+# =====================================================
+
+@dataclass
+class ZohoCRMConfig(IntegrationConfig):
+    """
+    Zoho CRM integration configuration for TNT lead management
+
+    Business Requirements:
+    - Real-time lead creation in Zoho CRM
+    - Bidirectional data sync for status updates
+    - Activity tracking for all lead interactions
+    - Revenue pipeline management
+    """
+
+    service_name: str = "zoho_crm"
+    integration_type: IntegrationType = IntegrationType.CRM
+
+    # OAuth 2.0 Configuration
+    client_id: str = field(default_factory=lambda: os.getenv('ZOHO_CLIENT_ID', ''))
+    client_secret: str = field(default_factory=lambda: os.getenv('ZOHO_CLIENT_SECRET', ''))
+    refresh_token: str = field(default_factory=lambda: os.getenv('ZOHO_REFRESH_TOKEN', ''))
+
+    # API Configuration
+    base_url: str = "https://www.zohoapis.com/crm/v2"
+    scopes: List[str] = field(default_factory=lambda: [
+        "ZohoCRM.modules.ALL",
+        "ZohoCRM.settings.READ",
+        "ZohoCRM.users.READ"
+    ])
+
+    # Data Mapping Configuration
+    lead_mapping: Dict[str, str] = field(default_factory=lambda: {
+        # TNT Field -> Zoho Field
+        "company_name": "Company",
+        "contact_name": "Last_Name",
+        "email": "Email",
+        "phone": "Phone",
+        "service_type": "Service_Type__c",  # Custom field
+        "estimated_value": "Deal_Value__c",  # Custom field
+        "lead_score": "Lead_Score__c",  # Custom field
+        "source": "Lead_Source",
+        "pickup_location": "Pickup_Location__c",  # Custom field
+        "destination": "Destination__c",  # Custom field
+        "service_date": "Service_Date__c"  # Custom field
+    })
+
+    # Sync Configuration
+    webhook_url: str = field(default_factory=lambda: os.getenv('TNT_WEBHOOK_URL', '') + '/webhooks/crm-updates')
+    sync_direction: str = "bidirectional"  # 'inbound', 'outbound', 'bidirectional'
+    batch_size: int = 50
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.service_name = "zoho_crm"
+        self.integration_type = IntegrationType.CRM
+
+    async def check_connectivity(self) -> str:
+        """Test Zoho API connectivity"""
+        import aiohttp
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{self.base_url}/settings/modules") as response:
+                return "healthy" if response.status == 200 else "warning"
+
+    def get_headers(self, access_token: str) -> Dict[str, str]:
+        """Generate request headers for Zoho API calls"""
+        return {
+            "Authorization": f"Zoho-oauthtoken {access_token}",
+            "Content-Type": "application/json",
+            "User-Agent": "TNT-Lead-System/2.0"
+        }
+
+    @instrumented("format")
+    def format_lead_for_zoho(self, tnt_lead: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert TNT lead data to Zoho CRM format"""
+        zoho_lead = {}
+
+        for tnt_field, zoho_field in self.lead_mapping.items():
+            if tnt_field in tnt_lead and tnt_lead[tnt_field] is not None:
+                zoho_lead[zoho_field] = tnt_lead[tnt_field]
+
+        # Add TNT-specific metadata
+        zoho_lead.update({
+            "Lead_Source": tnt_lead.get("source", "TNT Website"),
+            "TNT_Lead_ID__c": tnt_lead.get("lead_id"),
+            "Created_by_TNT_System__c": True,
+            "Lead_Priority__c": self._calculate_priority(tnt_lead.get("lead_score", 0))
+        })
+
+        return {"data": [zoho_lead]}
+
+    def _calculate_priority(self, lead_score: int) -> str:
+        """Convert TNT lead score to Zoho priority"""
+        if lead_score >= 80:
+            return "Critical"
+        elif lead_score >= 60:
+            return "High"
+        elif lead_score >= 40:
+            return "Medium"
+        else:
+            return "Low"
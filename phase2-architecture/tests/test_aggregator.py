@@ -0,0 +1,181 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from integration_configs.aggregator import MetricsAggregator
+from integration_configs.tracing import LeadTracer, TraceBatchExporter
+
+CREATED = datetime(2026, 10, 14, 9, 30)  # a Wednesday
+
+
+def make_lead(**overrides):
+    lead = {
+        "created_at": CREATED,
+        "service_type": "corporate",
+        "source": "website",
+        "estimated_value": 500.0,
+        "status": "new",
+    }
+    lead.update(overrides)
+    return lead
+
+
+def funnel(aggregator, dimension="all", value=""):
+    summary = aggregator.daily_summary(CREATED.date(), dimension, value)
+    return {
+        column: summary.get(column, 0)
+        for column in ("leads_created", "leads_contacted", "leads_qualified",
+                       "leads_converted", "converted_revenue")
+    }
+
+
+def test_status_progression_updates_funnel():
+    aggregator = MetricsAggregator()
+    lead = make_lead()
+    aggregator.record_lead_created(lead)
+    aggregator.record_lead_status_change(lead, "new", "contacted")
+    aggregator.record_lead_status_change(lead, "contacted", "qualified")
+    aggregator.record_lead_status_change(lead, "qualified", "converted")
+
+    assert funnel(aggregator) == {
+        "leads_created": 1, "leads_contacted": 1, "leads_qualified": 1,
+        "leads_converted": 1, "converted_revenue": 500.0,
+    }
+
+
+def test_converted_to_lost_drops_out_of_every_stage():
+    aggregator = MetricsAggregator()
+    lead = make_lead(status="converted")
+    aggregator.record_lead_created(lead)
+    aggregator.record_lead_status_change(lead, "converted", "lost")
+
+    expected = {
+        "leads_created": 1, "leads_contacted": 0, "leads_qualified": 0,
+        "leads_converted": 0, "converted_revenue": 0.0,
+    }
+    assert funnel(aggregator) == expected
+    assert funnel(aggregator, "service_type", "corporate") == expected
+    assert funnel(aggregator, "source", "website") == expected
+
+
+def test_skipping_stages_counts_each_stage_once():
+    aggregator = MetricsAggregator()
+    lead = make_lead()
+    aggregator.record_lead_created(lead)
+    aggregator.record_lead_status_change(lead, None, "qualified")
+    aggregator.record_lead_status_change(lead, "qualified", "qualified")
+
+    assert funnel(aggregator)["leads_contacted"] == 1
+    assert funnel(aggregator)["leads_qualified"] == 1
+
+
+def test_response_times_and_percentiles():
+    aggregator = MetricsAggregator()
+    for minutes in range(1, 11):
+        lead = make_lead()
+        aggregator.record_lead_created(lead)
+        aggregator.record_response(lead, CREATED + timedelta(minutes=minutes))
+
+    summary = aggregator.daily_summary(CREATED.date())
+    assert summary["responses_measured"] == 10
+    assert summary["responses_under_5min"] == 5
+    assert summary["avg_response_time_minutes"] == pytest.approx(5.5)
+    assert summary["p50_response_time_minutes"] == pytest.approx(5.5, abs=0.5)
+
+
+def test_unanswered_trace_counts_as_sla_violation():
+    aggregator = MetricsAggregator()
+    tracer = LeadTracer()
+    tracer.add_exporter(aggregator.record_trace)
+
+    tracer.start_trace("lead-1")
+    with pytest.raises(ConnectionError):
+        with tracer.span("lead-1", "fanout", channel="email"):
+            raise ConnectionError("smtp down")
+    with tracer.span("lead-1", "fanout", channel="slack"):
+        pass
+    tracer.finish_trace("lead-1")
+
+    summary = aggregator.daily_summary(datetime.utcnow().date())
+    assert summary["sla_violations"] == 1
+    assert summary.get("responses_measured", 0) == 0
+
+
+def test_traced_response_reaches_breakdown_rows():
+    aggregator = MetricsAggregator()
+    tracer = LeadTracer()
+    tracer.add_exporter(aggregator.record_trace)
+
+    tracer.start_trace("lead-1", service_type="airport", source="website")
+    with tracer.span("lead-1", "fanout", channel="email"):
+        pass
+    tracer.finish_trace("lead-1")
+
+    today = datetime.utcnow().date()
+    for dimension, value in (("all", ""), ("service_type", "airport"), ("source", "website")):
+        summary = aggregator.daily_summary(today, dimension, value)
+        assert summary["responses_measured"] == 1, dimension
+        assert summary["p50_response_time_minutes"] is not None
+
+
+def test_traced_sends_count_the_exporters_email_rows():
+    connection = FakeConnection()
+    exporter = TraceBatchExporter(connection)
+    aggregator = MetricsAggregator()
+    tracer = LeadTracer()
+    tracer.add_exporter(exporter)
+    tracer.add_exporter(aggregator.record_trace)
+
+    tracer.start_trace("lead-1")
+    for channel in ("email", "sms", "slack"):
+        with tracer.span("lead-1", "fanout", channel=channel):
+            pass
+    tracer.finish_trace("lead-1")
+    exporter.flush()
+
+    written = [row[1] for sql, rows in connection.log if "lead_interactions" in sql for row in rows]
+    assert sorted(written) == ["email_sent", "sms_sent"]
+    assert aggregator.daily_summary(datetime.utcnow().date())["emails_sent"] == written.count("email_sent")
+
+
+class FakeCursor:
+    def __init__(self, log):
+        self.log = log
+
+    def execute(self, sql, params):
+        self.log.append((sql, params))
+
+    def executemany(self, sql, rows):
+        self.log.append((sql, list(rows)))
+
+    def fetchone(self):
+        return (None,)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.log = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self.log)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def test_flush_writes_deltas_once():
+    connection = FakeConnection()
+    aggregator = MetricsAggregator(connection)
+    aggregator.record_lead_created(make_lead())
+
+    assert aggregator.flush() == 3  # overall, service_type, source
+    assert aggregator.flush() == 0
+    inserts = [params for sql, params in connection.log if sql.lstrip().startswith("INSERT INTO daily_metrics ")]
+    assert inserts[0][0] == date(2026, 10, 14)
@@ -0,0 +1,92 @@
+import asyncio
+import inspect
+import random
+
+import pytest
+
+from integration_configs.metrics import Histogram, IntegrationMetrics, get_integration_metrics, instrumented
+
+
+def test_quantiles_are_accurate_between_bucket_bounds():
+    rng = random.Random(7)
+    values = sorted(rng.uniform(130, 160) for _ in range(200))
+    histogram = Histogram()
+    for value in values:
+        histogram.observe(value)
+
+    for q in (0.50, 0.95, 0.99):
+        assert histogram.quantile(q) == pytest.approx(values[int(q * len(values)) - 1], abs=1.0)
+
+
+def test_bucket_placement_matches_prometheus_le():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 1.0, 2.0):
+        histogram.observe(value)
+
+    # A value equal to a bound falls in that bound's bucket (le = less or equal)
+    assert histogram.counts == [2, 2, 1]
+    assert histogram.cumulative_counts() == [("0.1", 2), ("1.0", 4), ("+Inf", 5)]
+
+
+def test_render_prometheus_histogram_and_escaping():
+    metrics = IntegrationMetrics(buckets=(0.1, 1.0))
+    metrics.observe_latency('crm "eu"\\west', "send", 0.5)
+    metrics.observe_latency('crm "eu"\\west', "send", 3)
+
+    text = metrics.render_prometheus()
+    labels = 'service="crm \\"eu\\"\\\\west",operation="send"'
+    assert "# TYPE tnt_integration_call_duration_seconds histogram" in text
+    assert f'tnt_integration_call_duration_seconds_bucket{{{labels},le="0.1"}} 0' in text
+    assert f'tnt_integration_call_duration_seconds_bucket{{{labels},le="1.0"}} 1' in text
+    assert f'tnt_integration_call_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"tnt_integration_call_duration_seconds_sum{{{labels}}} 3.5" in text
+    assert f"tnt_integration_call_duration_seconds_count{{{labels}}} 2" in text
+    assert text.endswith("\n")
+
+
+def test_call_tracker_counts_errors_by_exception_type():
+    metrics = IntegrationMetrics()
+    with metrics.track("slack", "send"):
+        pass
+    for error in (TimeoutError, TimeoutError, ValueError):
+        with pytest.raises(error):
+            with metrics.track("slack", "send"):
+                raise error()
+
+    operation = metrics.snapshot()["slack"]["operations"]["send"]
+    assert operation["count"] == 4
+    assert operation["in_flight"] == 0
+    assert operation["errors"] == {"TimeoutError": 2, "ValueError": 1}
+    assert 'tnt_integration_errors_total{service="slack",operation="send",error="TimeoutError"} 2' in \
+        metrics.render_prometheus()
+
+
+class FakeConfig:
+    service_name = "test_instrumented"
+
+    @instrumented("format")
+    def format(self, value):
+        return value * 2
+
+    @instrumented("send")
+    async def send(self, value):
+        await asyncio.sleep(0)
+        if value is None:
+            raise ConnectionError("down")
+        return value
+
+
+def test_instrumented_tracks_sync_and_async_methods():
+    metrics = get_integration_metrics()
+    config = FakeConfig()
+
+    assert config.format(2) == 4
+    assert inspect.iscoroutinefunction(FakeConfig.send)
+    assert asyncio.run(config.send("ok")) == "ok"
+    with pytest.raises(ConnectionError):
+        asyncio.run(config.send(None))
+
+    operations = metrics.snapshot()["test_instrumented"]["operations"]
+    assert operations["format"]["count"] == 1
+    assert operations["send"]["count"] == 2
+    assert operations["send"]["errors"] == {"ConnectionError": 1}
@@ -0,0 +1,62 @@
+import asyncio
+import multiprocessing
+
+import pytest
+
+from integration_configs.shared_state import LocalStateBackend, SharedStateBackend, _gcra
+
+
+def test_gcra_spaces_calls_by_emission_interval():
+    tat = None
+    waits = []
+    for _ in range(4):
+        wait, tat = _gcra(tat, now=100.0, rate_per_minute=60, burst=1)
+        waits.append(wait)
+    assert waits == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_gcra_allows_burst_then_throttles():
+    tat = None
+    waits = []
+    for _ in range(5):
+        wait, tat = _gcra(tat, now=100.0, rate_per_minute=60, burst=3)
+        waits.append(wait)
+    assert waits == [0.0, 0.0, 0.0, 1.0, 2.0]
+
+
+def test_gcra_recovers_after_idle_period():
+    _, tat = _gcra(None, now=100.0, rate_per_minute=60, burst=1)
+    wait, _ = _gcra(tat, now=105.0, rate_per_minute=60, burst=1)
+    assert wait == 0.0
+
+
+def test_incomplete_backend_fails_at_construction():
+    class ReserveOnly(SharedStateBackend):
+        async def reserve(self, service, rate_per_minute, burst=1):
+            return 0.0
+
+    with pytest.raises(TypeError):
+        ReserveOnly()
+
+
+def test_local_backend_shares_state_through_manager():
+    with multiprocessing.Manager() as manager:
+        first = LocalStateBackend(manager.dict(), manager.Lock())
+        second = LocalStateBackend(first.state, first.lock)  # as another worker would see it
+
+        async def scenario():
+            waits = [await backend.reserve("zoho_crm", rate_per_minute=600)
+                     for backend in (first, second, first)]
+            await first.publish_health("zoho_crm", {"status": "healthy"})
+            return waits, await second.get_health()
+
+        waits, health = asyncio.run(scenario())
+
+    assert waits[0] == 0.0
+    assert waits[1] == pytest.approx(0.1, abs=0.02)
+    assert waits[2] == pytest.approx(0.2, abs=0.02)
+    assert health == {"zoho_crm": {"status": "healthy"}}
+
+
+def test_zero_rate_is_unlimited():
+    assert asyncio.run(LocalStateBackend().reserve("slack", rate_per_minute=0)) == 0.0
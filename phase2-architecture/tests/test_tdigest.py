@@ -0,0 +1,52 @@
+import bisect
+import json
+import random
+
+import pytest
+
+from integration_configs.tdigest import TDigest
+
+
+def rank_error(ordered, estimate, q):
+    """t-digest bounds the error in rank, not in value"""
+    return abs(bisect.bisect_left(ordered, estimate) / len(ordered) - q)
+
+
+def test_empty_digest_has_no_quantiles():
+    digest = TDigest()
+    assert digest.quantile(0.5) is None
+    assert TDigest.from_dict(digest.to_dict()).quantile(0.5) is None
+
+
+def test_single_value():
+    digest = TDigest()
+    digest.add(4.2)
+    assert digest.quantile(0.01) == pytest.approx(4.2)
+    assert digest.quantile(0.99) == pytest.approx(4.2)
+
+
+@pytest.mark.parametrize("q", [0.5, 0.95, 0.99, 0.999])
+def test_merged_serialized_digests_match_exact_quantiles(q):
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0, 1) for _ in range(30_000)]
+
+    # Three "processes" each persist a digest; the database copy is merged back
+    merged = TDigest()
+    for start in range(0, len(values), 10_000):
+        part = TDigest()
+        part.update(values[start:start + 10_000])
+        stored = json.loads(json.dumps(part.to_dict()))
+        merged.merge(TDigest.from_dict(stored))
+
+    assert len(merged) == len(values)
+    assert merged.min == pytest.approx(min(values), abs=1e-6)
+    assert merged.max == pytest.approx(max(values), abs=1e-6)
+    assert rank_error(sorted(values), merged.quantile(q), q) < 0.005
+
+
+def test_round_trip_keeps_digest_compact():
+    digest = TDigest(compression=100)
+    digest.update(range(100_000))
+    stored = digest.to_dict()
+    assert len(stored["centroids"]) < 200
+    assert TDigest.from_dict(stored).quantile(0.5) == pytest.approx(50_000, rel=0.02)
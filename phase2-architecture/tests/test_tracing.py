@@ -0,0 +1,144 @@
+import pytest
+
+from integration_configs.tracing import LeadTracer, TraceBatchExporter
+
+
+def fail(tracer, lead_id, stage, channel=None):
+    with pytest.raises(ConnectionError):
+        with tracer.span(lead_id, stage, channel=channel):
+            raise ConnectionError("delivery failed")
+
+
+def test_internal_fanout_does_not_stop_the_sla_clock():
+    tracer = LeadTracer()
+    tracer.start_trace("lead-1")
+    fail(tracer, "lead-1", "fanout", "email")
+    with tracer.span("lead-1", "fanout", channel="slack"):
+        pass
+    trace = tracer.finish_trace("lead-1")
+
+    assert trace.response_seconds is None
+    assert trace.sla_met is False
+    assert tracer.sla_report()["sla_violations"] == 1
+    assert tracer.sla_report()["unanswered"] == 1
+
+
+def test_sms_response_counts_when_email_fails():
+    tracer = LeadTracer()
+    tracer.start_trace("lead-1")
+    fail(tracer, "lead-1", "smtp_accept")
+    with tracer.span("lead-1", "fanout", channel="sms"):
+        pass
+    trace = tracer.finish_trace("lead-1")
+
+    assert trace.sla_met is True
+    assert tracer.sla_report()["sla_violations"] == 0
+
+
+def test_late_span_attaches_to_finished_trace():
+    tracer = LeadTracer()
+    tracer.start_trace("lead-1")
+    with tracer.span("lead-1", "fanout", channel="slack"):
+        pass
+    trace = tracer.finish_trace("lead-1")
+    assert trace.sla_met is False
+
+    tracer.record_span("lead-1", "smtp_accept", 0.2)
+
+    assert tracer.sla_report()["active_traces"] == 0
+    assert [span.stage for span in trace.spans] == ["fanout", "smtp_accept"]
+    # The late accept is kept for the timeline but cannot rewrite the SLA result
+    assert trace.sla_met is False
+    assert trace.response_seconds is None
+    assert tracer.sla_report()["sla_violations"] == 1
+
+
+def test_unfinished_traces_are_bounded():
+    tracer = LeadTracer(max_active=2)
+    for lead in range(5):
+        tracer.start_trace(f"lead-{lead}")
+
+    report = tracer.sla_report()
+    assert report["active_traces"] == 2
+    assert report["traces_abandoned"] == 3
+    assert tracer.get_trace("lead-4") is not None
+
+
+class FlakyConnection:
+    """DB-API stand-in whose first `failures` commits fail"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.rows = []
+        self._staged = []
+
+    def cursor(self):
+        return self
+
+    def executemany(self, sql, rows):
+        self._staged.extend(rows)
+
+    def commit(self):
+        if self.failures:
+            self.failures -= 1
+            self._staged = []
+            raise ConnectionError("database unavailable")
+        self.rows.extend(self._staged)
+        self._staged = []
+
+    def rollback(self):
+        self._staged = []
+
+    def close(self):
+        pass
+
+
+def test_failed_export_keeps_the_batch():
+    connection = FlakyConnection(failures=1)
+    exporter = TraceBatchExporter(connection, batch_size=2)
+    tracer = LeadTracer()
+    tracer.add_exporter(exporter)
+
+    for lead in range(2):
+        tracer.start_trace(f"lead-{lead}")
+        with tracer.span(f"lead-{lead}", "fanout", channel="email"):
+            pass
+        tracer.finish_trace(f"lead-{lead}")  # the full batch fails to write
+
+    assert connection.rows == []
+    assert exporter.flush() == 2
+    assert [row[0] for row in connection.rows] == ["lead-0", "lead-1"]
+
+
+def test_background_flush_writes_full_batches():
+    connection = FlakyConnection()
+    exporter = TraceBatchExporter(connection, batch_size=2)
+    exporter.start(interval_seconds=60)
+    try:
+        tracer = LeadTracer()
+        tracer.add_exporter(exporter)
+        for lead in range(2):
+            tracer.start_trace(f"lead-{lead}")
+            with tracer.span(f"lead-{lead}", "fanout", channel="sms"):
+                pass
+            tracer.finish_trace(f"lead-{lead}")
+    finally:
+        exporter.stop()
+
+    assert [row[1] for row in connection.rows] == ["sms_sent", "sms_sent"]
+
+
+def test_total_percentiles_resolve_near_the_sla():
+    tracer = LeadTracer()
+    responses = sorted(130 + 30 * index / 199 for index in range(200))
+    for index, seconds in enumerate(responses):
+        lead_id = f"lead-{index}"
+        tracer.start_trace(lead_id, submitted_at=1_700_000_000)
+        tracer.record_span(lead_id, "smtp_accept", 0.5, end_time=1_700_000_000 + seconds)
+        tracer.finish_trace(lead_id)
+
+    total = tracer.stage_percentiles()["total"]
+    assert total["count"] == 200
+    assert total["p50_ms"] == pytest.approx(145_000, abs=1_000)
+    assert total["p95_ms"] == pytest.approx(158_500, abs=1_000)
+    assert total["p50_ms"] < total["p95_ms"] < total["p99_ms"]
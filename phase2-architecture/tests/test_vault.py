@@ -0,0 +1,141 @@
+import pytest
+from cryptography.fernet import Fernet, InvalidToken
+
+from integration_configs import vault as vault_module
+from integration_configs.vault import CredentialVault, get_credential_vault, reset_credential_vault
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class CountingCipher:
+    """Wraps a cipher and counts decrypt calls, i.e. cache misses"""
+
+    def __init__(self, cipher):
+        self.cipher = cipher
+        self.decrypts = 0
+
+    def encrypt(self, data):
+        return self.cipher.encrypt(data)
+
+    def decrypt(self, token):
+        self.decrypts += 1
+        return self.cipher.decrypt(token)
+
+
+def counting_vault(**kwargs):
+    vault = CredentialVault([Fernet.generate_key().decode()], **kwargs)
+    counter = CountingCipher(vault.cipher)
+    vault._cipher = counter
+    return vault, counter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(vault_module, "time", clock)
+    return clock
+
+
+def test_rotation_keeps_old_ciphertexts_readable():
+    old_key, new_key = Fernet.generate_key().decode(), Fernet.generate_key().decode()
+    old_token = CredentialVault([old_key]).encrypt("zoho-secret")
+
+    rotated_vault = CredentialVault([new_key, old_key])
+    assert rotated_vault.decrypt(old_token) == "zoho-secret"
+
+    rotated = rotated_vault.rotate(old_token)
+    assert CredentialVault([new_key]).decrypt(rotated) == "zoho-secret"
+    with pytest.raises(InvalidToken):
+        CredentialVault([old_key], cache_ttl_seconds=0).decrypt(rotated)
+
+
+def test_rotate_is_a_no_op_with_a_single_key():
+    vault = CredentialVault([Fernet.generate_key().decode()])
+    token = vault.encrypt("value")
+    assert vault.rotate(token) == token
+
+
+def test_cached_values_expire_after_ttl(clock):
+    vault, counter = counting_vault(cache_ttl_seconds=60)
+    token = vault.encrypt("secret")
+
+    assert vault.decrypt(token) == "secret"
+    clock.now += 59
+    assert vault.decrypt(token) == "secret"
+    assert counter.decrypts == 1
+
+    clock.now += 1
+    assert vault.decrypt(token) == "secret"
+    assert counter.decrypts == 2
+
+
+def test_cache_evicts_least_recently_used(clock):
+    vault, counter = counting_vault(cache_max_entries=2)
+    first, second, third = vault.encrypt_many(["a", "b", "c"])
+
+    vault.decrypt_many([first, second])
+    vault.decrypt(first)  # second is now least recently used
+    vault.decrypt(third)
+    assert counter.decrypts == 3
+
+    vault.decrypt(first)
+    assert counter.decrypts == 3
+    vault.decrypt(second)
+    assert counter.decrypts == 4
+
+
+def test_zero_ttl_disables_the_cache(clock):
+    vault, counter = counting_vault(cache_ttl_seconds=0)
+    token = vault.encrypt("secret")
+
+    vault.decrypt(token)
+    vault.decrypt(token)
+    assert counter.decrypts == 2
+
+
+def test_decrypt_many_decrypts_duplicates_once():
+    vault, counter = counting_vault()
+    token = vault.encrypt("secret")
+
+    assert vault.decrypt_many([token, token, token]) == ["secret"] * 3
+    assert counter.decrypts == 1
+
+
+def test_decrypt_fields_skips_empty_and_non_string_values():
+    vault = CredentialVault([Fernet.generate_key().decode()])
+    stored = vault.encrypt_fields({"client_id": "abc", "client_secret": "xyz", "refresh_token": "",
+                                   "scopes": ["leads"], "expires_in": 3600})
+
+    assert stored["refresh_token"] == "" and stored["scopes"] == ["leads"] and stored["expires_in"] == 3600
+    assert stored["client_id"] != "abc"
+    assert vault.decrypt_fields(stored) == {"client_id": "abc", "client_secret": "xyz", "refresh_token": "",
+                                            "scopes": ["leads"], "expires_in": 3600}
+    assert vault.decrypt_fields(stored, keys=["client_id", "refresh_token"])["client_secret"] == stored["client_secret"]
+
+
+def test_process_wide_vault_reads_the_environment(monkeypatch):
+    first_key, second_key = Fernet.generate_key().decode(), Fernet.generate_key().decode()
+    monkeypatch.setenv("INTEGRATION_ENCRYPTION_KEY", f"{first_key}, {second_key}")
+    reset_credential_vault()
+    try:
+        vault = get_credential_vault()
+        assert get_credential_vault() is vault
+        assert CredentialVault([first_key]).decrypt(vault.encrypt("secret")) == "secret"
+
+        monkeypatch.delenv("INTEGRATION_ENCRYPTION_KEY")
+        reset_credential_vault()
+        with pytest.raises(ValueError):
+            get_credential_vault()
+    finally:
+        reset_credential_vault()
+
+
+def test_missing_keys_are_rejected():
+    with pytest.raises(ValueError):
+        CredentialVault(["", "  "])
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import os
+
+from integration_configs.metrics import IntegrationMetrics
+from integration_configs.workers import WorkerPool, shard_for_lead
+
+# Handlers run in spawned worker processes, so they live at module level
+
+
+async def record_delivery(job, context):
+    if job.payload.get("crash") and job.attempts == 0:
+        os._exit(3)  # simulate a worker dying mid-delivery
+    await asyncio.sleep(0.001)
+    with open(job.payload["log"], "a") as log:
+        log.write(json.dumps([job.lead_id, job.payload["seq"], job.attempts]) + "\n")
+
+
+async def failing_delivery(job, context):
+    raise ValueError("rejected")
+
+
+async def noop_delivery(job, context):
+    pass
+
+
+def read_log(path):
+    deliveries = {}
+    with open(path) as log:
+        for line in log:
+            lead_id, seq, _ = json.loads(line)
+            deliveries.setdefault(lead_id, []).append(seq)
+    return deliveries
+
+
+def first_occurrences(seqs):
+    seen = []
+    for seq in seqs:
+        if seq not in seen:
+            seen.append(seq)
+    return seen
+
+
+def test_shard_for_lead_is_stable_and_in_range():
+    assert shard_for_lead("lead-42", 4) == shard_for_lead("lead-42", 4)
+    assert {shard_for_lead(f"lead-{i}", 4) for i in range(200)} == {0, 1, 2, 3}
+
+
+def test_per_lead_order_survives_worker_restart(tmp_path):
+    log = str(tmp_path / "deliveries.jsonl")
+    pool = WorkerPool(record_delivery, num_workers=2, concurrency=4, restart_backoff=0.05)
+    pool.start()
+    try:
+        for seq in range(15):
+            for lead in range(6):
+                payload = {"seq": seq, "log": log}
+                if lead == 2 and seq == 5:
+                    payload["crash"] = True
+                pool.submit(f"lead-{lead}", "crm", payload)
+    finally:
+        summary = pool.stop(timeout=60)
+
+    assert summary["restarts"] == 1
+    assert summary["undelivered"] == 0
+    assert summary["completed"] == 90
+
+    deliveries = read_log(log)
+    assert sorted(deliveries) == [f"lead-{lead}" for lead in range(6)]
+    for lead_id, seqs in deliveries.items():
+        # At-least-once: replays may repeat a delivery, but never reorder them
+        assert first_occurrences(seqs) == list(range(15)), lead_id
+
+
+def test_handler_errors_are_reported_not_restarted(tmp_path):
+    pool = WorkerPool(failing_delivery, num_workers=1, metrics=IntegrationMetrics())
+    pool.start()
+    try:
+        for lead in range(3):
+            pool.submit(f"lead-{lead}", "slack")
+    finally:
+        summary = pool.stop(timeout=30)
+
+    assert summary["completed"] == 3
+    assert summary["errors"] == 3
+    assert summary["restarts"] == 0
+    assert pool.metrics.snapshot()["slack"]["operations"]["delivery"]["errors"] == {"ValueError": 3}
+
+
+def test_throttle_failures_are_reported_as_delivery_errors(monkeypatch):
+    # Slack is enabled but its config cannot be built without a vault key
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", "https://hooks.slack.invalid/T000")
+    monkeypatch.delenv("INTEGRATION_ENCRYPTION_KEY", raising=False)
+
+    pool = WorkerPool(noop_delivery, num_workers=1, metrics=IntegrationMetrics())
+    pool.start()
+    try:
+        for lead in range(3):
+            pool.submit(f"lead-{lead}", "slack")
+    finally:
+        summary = pool.stop(timeout=30)
+
+    assert summary["completed"] == 3
+    assert summary["errors"] == 3
+    assert summary["undelivered"] == 0
+    assert summary["restarts"] == 0
+    assert pool.metrics.snapshot()["slack"]["operations"]["delivery"]["errors"] == {"ValueError": 3}